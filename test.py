@@ -1,71 +1,629 @@
 import sys
 import csv
+import io
 import json
 import os
-from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QStackedWidget, QListWidget, 
+from array import array
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+
+try:
+    # orjson serializes to bytes directly and is several times faster than stdlib json
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel,
+                             QLineEdit, QPushButton, QStackedWidget, QListWidget,
                              QHBoxLayout, QFileDialog, QMessageBox, QListWidgetItem,
                              QCheckBox, QComboBox, QGridLayout, QSpinBox, QDoubleSpinBox,
-                             QTableWidget, QTableWidgetItem)
-from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QTableView, QStyledItemDelegate, QFormLayout)
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex,
+                          QObject, QRunnable, QThreadPool, QStringListModel,
+                          QTimer)
+
+def _set_spin_value(widget, value, cast):
+    """Sets a spin box from a serialized value, falling back to its minimum."""
+    try:
+        widget.setValue(cast(value))
+    except (ValueError, TypeError):
+        widget.setValue(widget.minimum())
+
+
+# Widget accessors keyed by exact type, replacing per-widget isinstance chains
+_GETTERS = {
+    QLineEdit: lambda w: w.text() or None,
+    QComboBox: lambda w: w.currentText() if w.currentIndex() > 0 else None,
+    QCheckBox: lambda w: "ON" if w.isChecked() else "OFF",
+    QSpinBox: lambda w: w.value() if w.value() != w.minimum() else None,
+    QDoubleSpinBox: lambda w: w.value() if w.value() != w.minimum() else None,
+}
+
+_SETTERS = {
+    QLineEdit: lambda w, v: w.setText(v),
+    QComboBox: lambda w, v: w.setCurrentText(v),
+    QCheckBox: lambda w, v: w.setChecked(v == "ON"),
+    QSpinBox: lambda w, v: _set_spin_value(w, v, int),
+    QDoubleSpinBox: lambda w, v: _set_spin_value(w, v, float),
+}
+
+_CLEARERS = {
+    QLineEdit: lambda w: w.clear(),
+    QComboBox: lambda w: w.setCurrentIndex(0),
+    QCheckBox: lambda w: w.setChecked(False),
+    QSpinBox: lambda w: w.setValue(w.minimum()),
+    QDoubleSpinBox: lambda w: w.setValue(w.minimum()),
+}
+
+
+# Qt enum members bound once; data()/flags() run for every visible cell
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_CHECKSTATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+_CHECKABLE_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+_EDITABLE_FLAGS = (Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsEnabled
+                   | Qt.ItemFlag.ItemIsSelectable)
+
+
+def _build_checkbox_field(field_def):
+    return QCheckBox(field_def.get("label", "Unknown"))
+
+
+def _build_dropdown_field(field_def):
+    widget = QComboBox()
+    widget.addItems(field_def.get("options", []))
+    return widget
+
+
+def _build_numeric_field(field_def):
+    if "decimal_places" in field_def:
+        widget = QDoubleSpinBox()
+        widget.setDecimals(field_def["decimal_places"])
+    else:
+        widget = QSpinBox()
+    widget.setMinimum(field_def.get("min", 0))
+    widget.setMaximum(field_def.get("max", 999999))
+    return widget
+
+
+def _build_text_field(field_def):
+    return QLineEdit()
+
+
+_FIELD_BUILDERS = {
+    "checkbox": _build_checkbox_field,
+    "dropdown": _build_dropdown_field,
+    "numeric": _build_numeric_field,
+    "text": _build_text_field,
+}
+
+
+# Shared description for the repeated DLTD/DLTMAX/DLTF interval rows
+_ADDITIONAL_INTERVALS = sys.intern("Additional intervals can be specified")
+
+
+@lru_cache(maxsize=None)
+def _numbered_headers(prefix, count):
+    """Shared "WB1..WBn"-style header tuples, built once per (prefix, count)."""
+    return tuple(f"{prefix}{i + 1}" for i in range(count))
+
+
+@lru_cache(maxsize=32)
+def _structure_rows(max_nstr):
+    """Dynamic Structures row definitions for a given maximum NSTR.
+
+    Cached so stepping NSTR back and forth reuses the same frozen dicts,
+    which also lets patch_rows keep the stores of unchanged rows."""
+    return tuple(
+        MappingProxyType({
+            "label": sys.intern(f"STRUCT_{i + 1}"),
+            "type": "text",
+            "description": f"Structure {i + 1} parameters for each branch",
+        })
+        for i in range(max_nstr)
+    )
+
+
+def _dlt_fields(label, first_description, extra=9):
+    """Builds a timestep field list: one leading row plus shared repeats."""
+    repeated = {"label": label, "type": "numeric", "decimal_places": 2,
+                "description": _ADDITIONAL_INTERVALS}
+    return [{"label": label, "type": "numeric", "decimal_places": 2,
+             "description": first_description}] + [repeated] * extra
+
+
+def _intern_tab_strings(tab_data):
+    """Interns every string in the tab schema so repeated values share one
+    object, and deduplicates option lists into shared tuples."""
+    option_cache = {}
+    for tab_def in tab_data.values():
+        for field_def in tab_def.get("fields", tab_def.get("rows", [])):
+            for key, value in field_def.items():
+                if isinstance(value, str):
+                    field_def[key] = sys.intern(value)
+                elif isinstance(value, list):
+                    shared = tuple(sys.intern(v) if isinstance(v, str) else v for v in value)
+                    field_def[key] = option_cache.setdefault(shared, shared)
+    return tab_data
+
+
+# Tabular tabs grouped by the dimension that drives their column count
+_NWB_TABS = frozenset({"Timestep Limitations", "Waterbody Definition", "Calculations", "Dead Sea",
+                       "Heat Exchange", "Ice Cover", "Transport Scheme", "Hydaulic Coefficients",
+                       "Vertical Eddy Viscosity"})
+_NBR_TABS = frozenset({"Branch Geometry", "Initial Conditions", "Interpolation", "Structures"})
+
+# Tab groups in sync-key order: one entry per dimension read by sync_tabs
+_DIM_TAB_GROUPS = (_NWB_TABS, _NBR_TABS, ("Pipes",), ("Spillway",), ("Gates",),
+                   ("Pumps",), ("Internal Weirs",), ("Withdrawals",))
+
+# Column-header prefix per tabular tab, keyed by tab name for O(1) lookup
+_HEADER_PREFIX = {
+    "Timestep Limitations": "WB",
+    "Waterbody Definition": "WB",
+    "Calculations": "WB",
+    "Dead Sea": "WB",
+    "Heat Exchange": "WB",
+    "Ice Cover": "WB",
+    "Transport Scheme": "WB",
+    "Hydaulic Coefficients": "WB",
+    "Vertical Eddy Viscosity": "WB",
+    "Branch Geometry": "BR",
+    "Initial Conditions": "BR",
+    "Interpolation": "BR",
+    "Structures": "BR",
+    "Pipes": "PIPE",
+    "Spillway": "SP",
+    "Gates": "GATE",
+    "Pumps": "PUMP",
+    "Internal Weirs": "IW",
+    "Withdrawals": "WD",
+}
+
+_TAB_DATA = {
+    "Grid Dimensions and General Settings": {
+        "fields": [
+            {"label": "NWB", "type": "numeric", "description": "Number of waterbodies in the computational grid"},
+            {"label": "NBR", "type": "numeric", "description": "Number of branches in the computational grid"},
+            {"label": "IMX", "type": "numeric", "description": "Number of segments in the computational grid"},
+            {"label": "KMX", "type": "numeric", "description": "Number of layers in the computational grid"},
+            {"label": "NPROC", "type": "numeric", "description": "# of processors (INACTIVE at this time)"},
+            {"label": "CLOSEC", "type": "checkbox", "description": "close dialog box after executing if checked"}
+        ], "columns": 2
+    },
+    "Inflow/Outflow Dimensions": {
+        "fields": [
+            {"label": "NTR", "type": "numeric", "description": "Number of tributaries"},
+            {"label": "NST", "type": "numeric", "description": "Number of structures"},
+            {"label": "NIW", "type": "numeric", "description": "Number of internal weirs"},
+            {"label": "NWD", "type": "numeric", "description": "Number of withdrawals"},
+            {"label": "NGT", "type": "numeric", "description": "Number of gates"},
+            {"label": "NSP", "type": "numeric", "description": "Number of spillways"},
+            {"label": "NPI", "type": "numeric", "description": "Number of pipes"},
+            {"label": "NPU", "type": "numeric", "description": "Number of pumps"}
+        ], "columns": 2
+    },
+    "Constituent Dimensions": {
+        "fields": [
+            {"label": "NGC", "type": "numeric", "description": "Number of generic constituents"},
+            {"label": "NSS", "type": "numeric", "description": "Number of inorganic suspended solids"},
+            {"label": "NAL", "type": "numeric", "description": "Number of algal groups"},
+            {"label": "NEP", "type": "numeric", "description": "Number of epiphyton groups"},
+            {"label": "NBOD", "type": "numeric", "description": "Number of CBOD groups"},
+            {"label": "NMC", "type": "numeric", "description": "Number of macrophyte groups"},
+            {"label": "NZP", "type": "numeric", "description": "Number of zooplankton groups"}
+        ], "columns": 2
+    },
+    "Miscellaneous Dimensions": {
+        "fields": [
+            {"label": "NDAY", "type": "numeric", "description": "Maximum number of output dates or timestep related changes"},
+            {"label": "SELECTC", "type": "checkbox", "description": "Turn ON/OFF USGS automatic port selection from a multiple outlet structure where level is chosen by model to reach temperature target"},
+            {"label": "HABTATC", "type": "checkbox", "description": "Turn ON/OFF habitat analyses for fish and eutrophication variables"},
+            {"label": "ENVIRPC", "type": "checkbox", "description": "Turn ON/OFF environmental performance criteria"},
+            {"label": "AERATEC", "type": "checkbox", "description": "Turn ON/OFF aeration to waterbody with dissolved oxygen probe control"},
+            {"label": "INITUWL", "type": "checkbox", "description": "Turn ON/OFF initial water surface slope and velocity calculation for a river system"},
+            {"label": "ORGCC", "type": "checkbox", "description": "Turn ON/OFF simulates the organic matter as C rather than organic matter"},
+            {"label": "SED_DIAG", "type": "checkbox", "description": "Turn ON/OFF sediment diagenesis"}
+        ], "columns": 2
+    },
+    "Time Control": {
+        "fields": [
+            {"label": "TMSTRT", "type": "numeric", "description": "Starting time, Julian day"},
+            {"label": "TMEND", "type": "numeric", "description": "Ending time, Julian day"},
+            {"label": "YEAR", "type": "numeric", "description": "Starting year"}
+        ], "columns": 1
+    },
+    "Timestep Control": {
+        "fields": [
+            {"label": "NDLT", "type": "numeric", "description": "Number of timestep intervals"},
+            {"label": "DLTMIN", "type": "numeric", "decimal_places": 5, "description": "Minimum timestep, sec"}
+        ], "columns": 1
+    },
+    "Timestep Date": {
+        "fields": _dlt_fields("DLTD", "Beginning of timestep interval, Julian day"), "columns": 2
+    },
+    "Maximum Timestep": {
+        "fields": _dlt_fields("DLTMAX", "Maximum timestep, sec"), "columns": 2
+    },
+    "Timestep Fraction": {
+        "fields": _dlt_fields("DLTF", "Fraction of calculated maximum timestep necessary for numerical stability"), "columns": 2
+    },
+    "Timestep Limitations": {
+        "type": "tabular",
+        "rows": [
+            {"label": "VISC", "type": "checkbox", "description": "Turn ON/OFF waterbody viscosity and density calculations (e.g., for stratification)"},
+            {"label": "CELC", "type": "checkbox", "description": "Turn ON/OFF cell by cell heat exchange computations"},
+            {"label": "DLTADD", "type": "checkbox", "description": "Turn ON/OFF calculation of a minimum time step for waterbodies by adding the waterbody time step to the calculated minimum channel time step"}                    
+        ],
+        "columns_from": "NWB"
+    },
+    "Branch Geometry": { 
+        "type": "tabular",
+        "rows": [
+            {"label": "US", "type": "numeric", "description": "Branch upstream segment"},
+            {"label": "DS", "type": "numeric", "description": "Branch downstream segment"},
+            {"label": "UHS", "type": "numeric", "description": "Upstream boundary condition"},
+            {"label": "DHS", "type": "numeric", "description": "Downstream boundary condition"},
+            {"label": "NLMIN", "type": "numeric", "description": "Number of Layers"},
+            {"label": "SLOPE", "type": "numeric", "decimal_places": 4, "description": "Actual slope"},
+            {"label": "SLOPEC", "type": "numeric", "decimal_places": 4, "description": "Hydraulic equivalent slope (less than or equal to SLOPE)"}
+        ],
+        "columns_from": "NBR"
+    },
+    "Waterbody Definition": {
+        "type": "tabular",
+        "rows": [
+            {"label": "LAT", "type": "numeric", "decimal_places": 4, "description": "Upstream latitude of branch"},
+            {"label": "LONG", "type": "numeric", "decimal_places": 4, "description": "Upstream longitude of branch"},
+            {"label": "EBOT", "type": "numeric", "decimal_places": 4, "description": "Bottom elevation of the last cell of the branch"},
+            {"label": "BS", "type": "numeric", "decimal_places": 4, "description": "Distance from branch upstream end to last segment cell"},
+            {"label": "BE", "type": "numeric", "decimal_places": 4, "description": "Distance from branch upstream end to tributary"},
+            {"label": "JBDN", "type": "numeric", "description": "Downstream branch number"}
+        ],
+        "columns_from": "NWB"
+    },
+    "Initial Conditions": {
+        "type": "tabular",
+        "rows": [
+            {"label": "T2I", "type": "numeric", "decimal_places": 2, "description": "Initial temperature in Celcius"},
+            {"label": "ICEI", "type": "numeric", "decimal_places": 2, "description": "Initial ice thickness in meters"},
+            {"label": "WTYPEC", "type": "dropdown", "options": ["FRESH", "SALT"], "description": "Water type (FRESH or SALT)"},
+            {"label": "GRIDC", "type": "dropdown", "options": ["RECT", "TRAP"], "description": "Grid cell shape (RECT or TRAP)"}
+        ],
+        "columns_from": "NBR"
+    },
+    "Calculations": {
+        "type": "tabular",
+        "rows": [
+            {"label": "VBC", "type": "checkbox", "description": "Volume balance calculation, ON or OFF"},
+            {"label": "EBC", "type": "checkbox", "description": "Thermal energy balance calculation, ON or OFF"},
+            {"label": "MBC", "type": "checkbox", "description": "Mass balance calculation, ON or OFF"},
+            {"label": "PQC", "type": "checkbox", "description": "Density placed inflows, ON or OFF"},
+            {"label": "EVC", "type": "checkbox", "description": "Evaporation included in water budget, ON or OFF"},
+            {"label": "PRC", "type": "checkbox", "description": "Precipitation included, ON or OFF"},                    
+        ],
+        "columns_from": "NWB"
+    },
+    "Dead Sea": {
+        "type": "tabular",
+        "rows": [
+            {"label": "WINDC", "type": "checkbox", "description": "Turn ON/OFF wind"},
+            {"label": "QINC", "type": "checkbox", "description": "Turn ON/OFF all sources of water"},
+            {"label": "QOUTC", "type": "checkbox", "description": "Turn ON/OFF all sinks of water"},
+            {"label": "HEATC", "type": "checkbox", "description": "Turn ON/OFF heat exchange"}                
+        ],
+        "columns_from": "NWB"
+    },
+    "Interpolation": {
+        "type": "tabular",
+        "rows": [                    
+            {"label": "QINC", "type": "checkbox", "description": "Turn ON/OFF all sources of water"},
+            {"label": "DTRIC", "type": "checkbox", "description": "Turn ON/OFF all sinks of water"},
+            {"label": "HDIC", "type": "checkbox", "description": "Turn ON/OFF heat exchange"}                
+        ],
+        "columns_from": "NBR"
+    },
+    "Heat Exchange": {
+        "type": "tabular",
+        "rows": [
+            {"label": "SLHTC", "type": "dropdown", "options": ["TERM", "ET"],
+             "description": "Specify either term-by-term (TERM) or equilibrium temperature computations (ET) for surface heat exchange"},
+            {"label": "SROC", "type": "checkbox", "description": "Read in observed short wave solar radiation, ON or OFF"},
+            {"label": "RHEVC", "type": "checkbox", "description": "Turns ON/OFF Ryan-Harleman evaporation formula"},
+            {"label": "METIC", "type": "checkbox", "description": "Turns ON/OFF meteorological data interpolation"},
+            {"label": "FETCHC", "type": "checkbox", "description": "Turns ON/OFF fetch calculation"},
+            {"label": "AFW", "type": "numeric", "decimal_places": 2, "description": "a coefficient in the wind speed formulation"},
+            {"label": "BFW", "type": "numeric", "decimal_places": 2, "description": "b coefficient in the wind speed formulation"},
+            {"label": "CFW", "type": "numeric", "decimal_places": 2, "description": "ac coefficient in the wind speed formulation"},
+            {"label": "WINDH", "type": "numeric", "decimal_places": 2, "description": "Wind speed measurement height, m"}               
+        ],
+        "columns_from": "NWB"
+    },
+    "Ice Cover": {
+        "type": "tabular",
+        "rows": [
+            {"label": "ICEC", "type": "checkbox", "description": "Allow ice calculations"},
+            {"label": "SLICEC", "type": "dropdown", "options": ["SIMPLE", "DETAIL"], "description": "Specifies the method of ice cover calculations - either SIMPLE or DETAIL"},
+            {"label": "ALBEDO", "type": "numeric", "decimal_places": 2, "description": "Ratio of reflection to incident radiation (albedo of ice)"},
+            {"label": "HWI", "type": "numeric", "decimal_places": 2, "description": "Coefficient of water-ice heat exchange"},
+            {"label": "BETAI", "type": "numeric", "decimal_places": 2, "description": "Fraction of solar radiation absorbed in the ice surface"},
+            {"label": "GAMMAI", "type": "numeric", "decimal_places": 2, "description": "Solar radiation extinction coefficient, m-1"},
+            {"label": "ICEMIN", "type": "numeric", "decimal_places": 2, "description": "Minimum ice thickness before ice formation is allowed, m"},
+            {"label": "ICET2", "type": "numeric", "decimal_places": 2, "description": "Temperature above which ice formation is not allowed, °C"}                
+        ],
+        "columns_from": "NWB"
+    },
+    "Transport Scheme": {
+        "type": "tabular",
+        "rows": [
+            {"label": "SLTRC", "type": "dropdown", "options": ["ULTIMATE", "QUICKEST", "UPWIND"], 
+             "description": "Transport solution scheme, ULTIMATE, QUICKEST, or UPWIND"},
+            {"label": "THETA", "type": "numeric", "decimal_places": 2, "description": "Time-weighting for vertical advection scheme"}           
+        ],
+        "columns_from": "NWB"
+    },
+    "Hydaulic Coefficients": {
+        "type": "tabular",
+        "rows": [
+            {"label": "AX", "type": "numeric", "decimal_places": 2, "description": "Longitudinal eddy viscosity, m2 sec-1"},
+            {"label": "DX", "type": "numeric", "decimal_places": 2, "description": "Longitudinal eddy diffusivity, m2 sec-1"},
+            {"label": "CBHE", "type": "numeric", "decimal_places": 2, "description": "Coefficient of bottom heat exchange, W m-2 sec-1"},
+            {"label": "TSED", "type": "numeric", "decimal_places": 2, "description": "Sediment temperature, ºC"},
+            {"label": "FI", "type": "numeric", "decimal_places": 2, "description": "Interfacial friction factor"},
+            {"label": "TSEDF", "type": "numeric", "decimal_places": 2, "description": "Heat lost to sediments that is added back to water column"},
+            {"label": "FRICC", "type": "dropdown", "options": ["MANN", "CHEZY"], 
+             "description": "Bottom friction solution, MANN or CHEZY"}                
+        ],
+        "columns_from": "NWB"
+    },
+    "Vertical Eddy Viscosity": {
+        "type": "tabular",
+        "rows": [                    
+            {"label": "AZC", "type": "dropdown", "options": ["NICK", "PARAB", "RNG", "W2", "W2N", "TKE"],
+             "description": "Form of vertical turbulence closure algorithm, NICK, PARAB, RNG, W2, W2N, or TKE"},
+            {"label": "AZSLC", "type": "dropdown", "options": ["IMP", "EXP"], 
+             "description": "Specifies either implicit, IMP, or explicit, EXP, treatment of the vertical eddy viscosity in the longitudinal momentum equation"}, 
+            {"label": "AZMAX", "type": "numeric", "decimal_places": 5, "description": "Maximum value for vertical eddy viscosity, m2 s-1"}                
+        ],
+        "columns_from": "NWB"
+    },
+    "Structures": {
+        "type": "tabular",
+        "rows": [
+            {"label": "NSTR", "type": "numeric",  "description": "Number of branch outlet structures"},
+            {"label": "DYNSTRUC", "type": "checkbox", "description": "Use dynamic centerline elevation for the structure, \
+            usually the centerline elevation is fixed and specified with ESTR. If this is ON, the model will read a separate file for each branch called dynselevX.npt where X is the branch number."}                
+        ],
+        "columns_from": "NBR"
+    },
+    "Pipes": {
+        "type": "tabular",
+        "rows": [
+            {"label": "IUPI", "type": "numeric", "description": "Upstream segment number"},
+            {"label": "IDPI", "type": "numeric", "description": "Downstream segment number"},
+            {"label": "EUPI", "type": "numeric", "decimal_places": 3, "description": "Elevation upstream invert, m"},
+            {"label": "EDPI", "type": "numeric", "decimal_places": 3, "description": "Elevation downstream invert, m"},
+            {"label": "WPI", "type": "numeric", "decimal_places": 3, "description": "Pipe diameter, m"},
+            {"label": "DLXPI", "type": "numeric", "decimal_places": 3, "description": "Pipe length, m"},
+            {"label": "FPI", "type": "numeric", "decimal_places": 3, "description": "friction factor (Mannings)"},
+            {"label": "FMINPI", "type": "numeric", "decimal_places": 3, "description": "minor losses friction factor (Mannings)"},
+            {"label": "WTHLC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "DOWN or LAT, withdrawal control for at end of segment or middle"},
+            {"label": "DYNPIPE", "type": "checkbox", "description": "Dynamic pipe read input file, ON or OFF"},
+            {"label": "PUPIC", "type": "dropdown", "options": ["DISTR", "SPECIFY", "DENSITY"], "description": "PipeUp inflow: DISTR, SPECIFY, DENSITY"},
+            {"label": "ETUPI", "type": "numeric", "decimal_places": 3, "description": "PipeUp Elevation top in m if SPECIFY"},
+            {"label": "EBUPI", "type": "numeric", "decimal_places": 3, "description": "PipeUp Elevation bottom in m if SPECIFY"},
+            {"label": "KTUPI", "type": "numeric", "description": "PipeUp Selective withdrawal top layer, Top layer above which selective withdrawal will not occur"},
+            {"label": "KBUPI", "type": "numeric", "description": "PipeUp Selective withdrawal bottom layer, Bottom layer below which selective withdrawal will not occur"},
+            {"label": "PDPIC", "type": "dropdown", "options": ["DISTR", "SPECIFY", "DENSITY"], "description": "PipeDown inflow: DISTR, SPECIFY, DENSITY"},
+            {"label": "ETDPI", "type": "numeric", "decimal_places": 3, "description": "PipeDown Elevation top in m if SPECIFY"},
+            {"label": "EBDPI", "type": "numeric", "decimal_places": 3, "description": "PipeDown Elevation bottom in m if SPECIFY"},
+            {"label": "KTDPI", "type": "numeric", "description": "PipeDown Selective withdrawal top layer, Top layer above which selective withdrawal will not occur"},
+            {"label": "KBDPI", "type": "numeric", "description": "PipeDown Selective withdrawal bottom layer, Bottom layer below which selective withdrawal will not occur"}
+        ],
+        "columns_from": "NPI"
+    },
+    "Spillway": {
+        "type": "tabular",
+        "rows": [
+            {"label": "IUSP", "type": "numeric", "description": "Upstream segment number, spillway segment location"},
+            {"label": "IDSP", "type": "numeric", "description": "Downstream segment number, downstream segment spillway outflow enters"},
+            {"label": "ESP", "type": "numeric", "decimal_places": 3, "description": "Spillway elevation (crest), m"},
+            {"label": "BTSP1", "type": "numeric", "decimal_places": 3, "description": "Empirical coefficient for free-flowing conditions"},
+            {"label": "BTSP2", "type": "numeric", "decimal_places": 3, "description": "Empirical coefficient for submerged conditions"},
+            {"label": "LATSPC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal, DOWN or LAT"},
+            {"label": "PUSPC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the upstream spillway segment, DISTR, DENSITY, or SPECIFY"},
+            {"label": "ETUSP", "type": "numeric", "description": "Top elevation spillway inflows enter using SPECIFY option, m"},
+            {"label": "EBUSP", "type": "numeric", "description": "Bottom elevation spillway inflows enter using SPECIFY option, m"},
+            {"label": "KTUSP", "type": "numeric", "decimal_places": 3, "description": "Top layer above which selective withdrawal will not occur"},
+            {"label": "KBUSP", "type": "numeric", "decimal_places": 3, "description": "Bottom layer below which selective withdrawal will not occur"},
+            {"label": "PDSPC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the downstream spillway segment, DISTR, DENSITY, or SPECIFY"},
+            {"label": "ETDSP", "type": "numeric", "decimal_places": 3, "description": "Top elevation spillway inflows enter using SPECIFY option, m"},
+            {"label": "EBDSP", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation spillway inflows enter using SPECIFY option, m"},
+            {"label": "KTDSP", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
+            {"label": "KBDSP", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
+            {"label": "GASSPC", "type": "checkbox", "description": "Dissolved gas computations ON or OFF"},
+            {"label": "EQSP", "type": "numeric", "description": "Equation number for computing dissolved gas"},
+            {"label": "AGASSP", "type": "numeric", "decimal_places": 3, "description": "a empirical coefficient"},
+            {"label": "BGASSP", "type": "numeric", "decimal_places": 3, "description": "b empirical coefficient"},
+            {"label": "CGASSP", "type": "numeric", "decimal_places": 3, "description": "c empirical coefficient"}
+        ],
+        "columns_from": "NSP"
+    },
+    "Gates": {
+        "type": "tabular",
+        "rows": [
+            {"label": "IUGT", "type": "numeric", "description": "Upstream segment number"},
+            {"label": "IDGT", "type": "numeric", "description": "Downstream segment number"},
+            {"label": "EGT", "type": "numeric", "decimal_places": 3, "description": "Gate elevation, m"},
+            {"label": "A1GT", "type": "numeric", "decimal_places": 3, "description": "a1 coefficient in gate equation for free flowing conditions"},
+            {"label": "B1GT", "type": "numeric", "decimal_places": 3, "description": "b1 coefficient in gate equation for free flowing conditions"},
+            {"label": "G1GT", "type": "numeric", "decimal_places": 3, "description": "gamma1 coefficient for free flowing conditions"},
+            {"label": "A2GT", "type": "numeric", "decimal_places": 3, "description": "a2 coefficient in gate equation for submerged conditions"},
+            {"label": "B2GT", "type": "numeric", "decimal_places": 3, "description": "b2 coefficient in gate equation for submerged conditions"},
+            {"label": "G2GT", "type": "numeric", "decimal_places": 3, "description": "gamma2 coefficient for submerged conditions"},
+            {"label": "LATGTC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal at DOWN or LAT"},
+            {"label": "PUGTC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter the upstream gate segment, DISTR, DENSITY, or SPECIFY"},
+            {"label": "ETUGT", "type": "numeric", "decimal_places": 3, "description": "Top elevation gate inflows enter using the SPECIFY option, m"},
+            {"label": "EBUGT", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation gate inflows enter using the SPECIFY option, m"},
+            {"label": "KTUGT", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
+            {"label": "KBUGT", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
+            {"label": "PDGTC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter the downstream gate segment, DISTR, DENSITY, or SPECIFY"},
+            {"label": "ETDGT", "type": "numeric", "decimal_places": 3, "description": "Top elevation gate inflows enter using the SPECIFY option, m"},
+            {"label": "EBDGT", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation gate inflows enter using the SPECIFY option, m"},
+            {"label": "KTDGT", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
+            {"label": "KBDGT", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
+            {"label": "DYNGTC", "type": "dropdown", "options": ["B", "ZGT", "FLOW"], "description": "Either B, ZGT, or FLOW"},
+            {"label": "GASGTC", "type": "checkbox", "description": "Dissolved gas computations ON or OFF"},
+            {"label": "EQGT", "type": "numeric", "description": "Equation number for computing dissolved gas"},
+            {"label": "AGASGT", "type": "numeric", "decimal_places": 3, "description": "a empirical coefficient"},
+            {"label": "BGASGT", "type": "numeric", "decimal_places": 3, "description": "b empirical coefficient"},
+            {"label": "CGASGT", "type": "numeric", "decimal_places": 3, "description": "c empirical coefficient"}
+        ],
+        "columns_from": "NGT"
+    },
+    "Pumps": {
+        "type": "tabular",
+        "rows": [
+            {"label": "IUPU", "type": "numeric", "description": "Upstream segment number where water is withdrawn"},
+            {"label": "IDPU", "type": "numeric", "description": "Downstream segment number where water enters"},
+            {"label": "EPU", "type": "numeric", "decimal_places": 3, "description": "Elevation of pump, m"},
+            {"label": "STRTPU", "type": "numeric", "decimal_places": 3, "description": "Starting day of pumping Julian day"},
+            {"label": "ENDPU", "type": "numeric", "decimal_places": 3, "description": "Ending day of pumping Julian day"},
+            {"label": "EONPU", "type": "numeric", "decimal_places": 3, "description": "Pump starting elevation, m"},
+            {"label": "EOFFPU", "type": "numeric", "decimal_places": 3, "description": "Pump stopping elevation, m"},
+            {"label": "QPU", "type": "numeric", "decimal_places": 3, "description": "Pump flow rate, m3/s"},
+            {"label": "LATPUC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal, DOWN or LAT"},
+            {"label": "DYNPUM", "type": "checkbox", "description": "Dynamic pump control ON or OFF"},
+            {"label": "PPUC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the downstream pump segment, DISTR, DENSITY, or SPECIFY"},
+            {"label": "ETPU", "type": "numeric", "decimal_places": 3, "description": "Top elevation inflow enters using SPECIFY option, m"},
+            {"label": "EBPU", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation inflow enters using SPECIFY option, m"},
+            {"label": "KTPU", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
+            {"label": "KBPU", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"}
+        ],
+        "columns_from": "NPU"
+    },
+    "Internal Weirs": {
+        "type": "tabular",
+        "rows": [
+            {"label": "IWR", "type": "numeric", "description": "Internal weir segment number (RHS)"},
+            {"label": "KTWR", "type": "numeric", "description": "Internal weir layer top"},
+            {"label": "KBWR", "type": "numeric", "description": "Internal weir layer bottom"}
+        ],
+        "columns_from": "NIW"
+    },
+    "Withdrawals": {
+        "type": "tabular",
+        "rows": [
+            {"label": "WDIC", "type": "checkbox", "description": "Withdrawal interpolation, ON or OFF"},
+            {"label": "IWD", "type": "numeric", "description": "Withdrawal outflow segment"},
+            {"label": "EWD", "type": "numeric", "decimal_places": 3, "description": "Withdrawal centerline elevation"},
+            {"label": "KTWD", "type": "numeric", "description": "Withdrawal selective withdrawal top, Top layer above which selective withdrawal will not occur"},
+            {"label": "KBWD", "type": "numeric", "description": "Withdrawal selective withdrawal bottom, Bottom layer below which selective withdrawal will not occur"}
+        ],
+        "columns_from": "NWD"
+    }
+}
+
+
+_intern_tab_strings(_TAB_DATA)
+
+# Freeze the shared schema: every CompactApp instance reads the same
+# definitions, and the proxies guard against accidental mutation
+for _tab_def in _TAB_DATA.values():
+    _key = "fields" if "fields" in _tab_def else "rows"
+    _tab_def[_key] = [MappingProxyType(d) for d in _tab_def[_key]]
+del _tab_def, _key
+
+
+class _StateIOSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _StateIOTask(QRunnable):
+    """Runs a state serialize/parse job off the GUI thread."""
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.signals = _StateIOSignals()
+
+    def run(self):
+        try:
+            result = self.job()
+        except (IOError, ValueError) as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
 
 class UserDataTab(QWidget):
     """A reusable widget for a single tab with input fields and descriptions."""
+    # Emitted whenever any field's value changes (used for dirty tracking)
+    fieldChanged = pyqtSignal()
+
     def __init__(self, field_definitions, columns=1, parent=None):
         super().__init__(parent)
+        # Interned tag checked on hot paths instead of isinstance
+        self.kind = "user"
         self.field_definitions = field_definitions
         self.fields = []
         
-        self.layout = QGridLayout()
+        # QFormLayout relays out a single row on change, unlike QGridLayout's
+        # whole-grid measure, so prefer it for the common one-column case
+        use_form = columns == 1
+        self.layout = QFormLayout() if use_form else QGridLayout()
         row, col = 0, 0
-        
+
         for field_def in self.field_definitions:
             field_label = field_def.get("label", "Unknown")
-            
-            if field_def["type"] == "checkbox":
-                checkbox_widget = QCheckBox(field_label)
-                self.fields.append((field_label, checkbox_widget))
-                if "description" in field_def:
-                    description_label = QLabel(field_def["description"])
-                    font = QFont(); font.setPointSize(9); font.setItalic(True)
-                    description_label.setFont(font)
-                    description_label.setStyleSheet("color: grey;")
-                    description_label.setWordWrap(True)
+            field_type = field_def["type"]
+            entry_widget = _FIELD_BUILDERS.get(field_type, _build_text_field)(field_def)
+            self.fields.append((field_label, entry_widget))
+
+            description_label = None
+            if "description" in field_def:
+                description_label = QLabel(field_def["description"])
+                description_label.setProperty("role", "desc")
+                description_label.setWordWrap(True)
+
+            if use_form:
+                if field_type == "checkbox":
+                    self.layout.addRow(entry_widget)
+                else:
+                    self.layout.addRow(f"{field_label}:", entry_widget)
+                if description_label is not None:
+                    self.layout.addRow("", description_label)
+
+            elif field_type == "checkbox":
+                if description_label is not None:
                     checkbox_layout = QVBoxLayout()
-                    checkbox_layout.addWidget(checkbox_widget)
+                    checkbox_layout.addWidget(entry_widget)
                     checkbox_layout.addWidget(description_label)
                     self.layout.addLayout(checkbox_layout, row, col)
                 else:
-                    self.layout.addWidget(checkbox_widget, row, col)
+                    self.layout.addWidget(entry_widget, row, col)
 
             else:
                 label = QLabel(f"{field_label}:")
                 self.layout.addWidget(label, row, col)
-                if "description" in field_def:
-                    description_widget = QLabel(field_def["description"])
-                    font = QFont(); font.setPointSize(9); font.setItalic(True)
-                    description_widget.setFont(font)
-                    description_widget.setStyleSheet("color: grey;")
-                    description_widget.setWordWrap(True)
-                    self.layout.addWidget(description_widget, row + 1, col)
-                
-                if field_def["type"] == "dropdown":
-                    entry_widget = QComboBox()
-                    entry_widget.addItems(field_def.get("options", []))
-                elif field_def["type"] == "numeric":
-                    if "decimal_places" in field_def:
-                        entry_widget = QDoubleSpinBox()
-                        entry_widget.setDecimals(field_def["decimal_places"])
-                    else:
-                        entry_widget = QSpinBox()
-                    entry_widget.setMinimum(field_def.get("min", 0))
-                    entry_widget.setMaximum(field_def.get("max", 999999))
-                else:
-                    entry_widget = QLineEdit()
-                
+                if description_label is not None:
+                    self.layout.addWidget(description_label, row + 1, col)
                 self.layout.addWidget(entry_widget, row + 2, col)
-                self.fields.append((field_label, entry_widget))
 
             col += 1
             if col >= columns:
@@ -73,72 +631,337 @@ class UserDataTab(QWidget):
                 row += 3
         self.setLayout(self.layout)
 
-    def get_data(self):
-        """Returns a list of tuples with data from the tab's fields, keyed by label.
-        Empty fields return None."""
-        data_list = []
+        # Index widgets by label for O(1) lookup in set_data; duplicate labels
+        # (e.g. the repeated DLTD rows) keep their widgets in definition order
+        self._fields_by_label = {}
         for label, widget in self.fields:
+            self._fields_by_label.setdefault(label, []).append(widget)
+
+        # Forward every widget's change signal so owners can track dirtiness
+        for _, widget in self.fields:
             if isinstance(widget, QLineEdit):
-                value = widget.text()
-                data_list.append((label, value if value else None))
+                widget.textChanged.connect(self.fieldChanged)
             elif isinstance(widget, QComboBox):
-                value = widget.currentText()
-                data_list.append((label, value if widget.currentIndex() > 0 else None))
+                widget.currentIndexChanged.connect(self.fieldChanged)
             elif isinstance(widget, QCheckBox):
-                data_list.append((label, "ON" if widget.isChecked() else "OFF"))
-            elif isinstance(widget, QSpinBox):
-                value = widget.value()
-                data_list.append((label, str(value) if value != widget.minimum() else None))
-            elif isinstance(widget, QDoubleSpinBox):
-                value = widget.value()
-                data_list.append((label, str(value) if value != widget.minimum() else None))
-        return data_list
+                widget.stateChanged.connect(self.fieldChanged)
+            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+                widget.valueChanged.connect(self.fieldChanged)
+
+    def get_data(self):
+        """Returns a list of tuples with data from the tab's fields, keyed by label.
+        Empty fields return None."""
+        return [(label, _GETTERS[type(widget)](widget)) for label, widget in self.fields]
 
     def set_data(self, data_list):
         """Sets the text of input fields based on a provided list of (label, value) tuples."""
-        if not data_list or len(self.fields) != len(data_list):
+        if not data_list:
             self.clear_fields()
             return
-        
-        for (label, widget), (data_label, value) in zip(self.fields, data_list):
-            if label == data_label:
-                if value is None:
-                    self.clear_widget(widget)
-                    continue
-                
-                if isinstance(widget, QLineEdit):
-                    widget.setText(value)
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText(value)
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(value == "ON")
-                elif isinstance(widget, QSpinBox):
-                    try:
-                        widget.setValue(int(value))
-                    except (ValueError, TypeError):
-                        self.clear_widget(widget)
-                elif isinstance(widget, QDoubleSpinBox):
-                    try:
-                        widget.setValue(float(value))
-                    except (ValueError, TypeError):
-                        self.clear_widget(widget)
+
+        # Consume widgets per label in order so repeated labels map positionally
+        consumed = {}
+        for data_label, value in data_list:
+            widgets = self._fields_by_label.get(data_label)
+            if not widgets:
+                continue
+            index = consumed.get(data_label, 0)
+            if index >= len(widgets):
+                continue
+            consumed[data_label] = index + 1
+            widget = widgets[index]
+
+            if value is None:
+                self.clear_widget(widget)
+                continue
+
+            setter = _SETTERS.get(type(widget))
+            if setter:
+                setter(widget, value)
 
     def clear_widget(self, widget):
         """Helper function to clear a single widget based on its type."""
-        if isinstance(widget, QLineEdit):
-            widget.clear()
-        elif isinstance(widget, QComboBox):
-            widget.setCurrentIndex(0)
-        elif isinstance(widget, QCheckBox):
-            widget.setChecked(False)
-        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-            widget.setValue(widget.minimum())
+        clearer = _CLEARERS.get(type(widget))
+        if clearer:
+            clearer(widget)
 
     def clear_fields(self):
         """Clears all input fields in the tab."""
         for _, widget in self.fields:
             self.clear_widget(widget)
 
+class W2TableModel(QAbstractTableModel):
+    """Table model holding tabular tab data in plain Python lists.
+
+    Values are stored as strings ("ON"/"OFF" for checkbox rows), so
+    get_data/set_data operate on the backing store directly instead of
+    round-tripping through per-cell widgets."""
+
+    def __init__(self, row_definitions, parent=None):
+        super().__init__(parent)
+        self.row_definitions = row_definitions
+        self.column_headers = ()
+        self._data = []  # one list of cell values per row
+
+    @staticmethod
+    def default_value(row_def):
+        """Returns the default cell value for a row definition."""
+        cell_type = row_def.get("type", "checkbox")
+        if cell_type == "checkbox":
+            return 0
+        elif cell_type == "numeric":
+            return float(row_def.get("min", 0))
+        elif cell_type == "dropdown":
+            options = row_def.get("options", [])
+            return options[0] if options else ""
+        return ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.row_definitions)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.column_headers)
+
+    def flags(self, index):
+        if not index.isValid():
+            return _NO_FLAGS
+        row_def = self.row_definitions[index.row()]
+        if row_def.get("type", "checkbox") == "checkbox":
+            return _CHECKABLE_FLAGS
+        return _EDITABLE_FLAGS
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        row_def = self.row_definitions[index.row()]
+        value = self._data[index.row()][index.column()]
+        cell_type = row_def.get("type", "checkbox")
+        if cell_type == "checkbox":
+            if role == _CHECKSTATE_ROLE:
+                return _CHECKED if value else _UNCHECKED
+            return None
+        if role == _DISPLAY_ROLE and cell_type == "numeric":
+            if "decimal_places" in row_def:
+                return f"{value:.{row_def['decimal_places']}f}"
+            return str(int(value))
+        if role in (_DISPLAY_ROLE, _EDIT_ROLE):
+            return value
+        return None
+
+    def setData(self, index, value, role=_EDIT_ROLE):
+        if not index.isValid():
+            return False
+        row_def = self.row_definitions[index.row()]
+        if row_def.get("type", "checkbox") == "checkbox":
+            if role != _CHECKSTATE_ROLE:
+                return False
+            self._data[index.row()][index.column()] = 1 if Qt.CheckState(value) == _CHECKED else 0
+        else:
+            if role != _EDIT_ROLE:
+                return False
+            self.set_value(index.row(), index.column(), value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == _DISPLAY_ROLE and section < len(self.column_headers):
+                return self.column_headers[section]
+        else:
+            if section < len(self.row_definitions):
+                if role == _DISPLAY_ROLE:
+                    return self.row_definitions[section]['label']
+                elif role == _TOOLTIP_ROLE:
+                    return self.row_definitions[section].get('description', '')
+        return None
+
+    def resize_columns(self, column_headers):
+        """Grows or shrinks every row store in place, keeping existing cells.
+
+        New columns are filled with the row's default; surplus columns are
+        truncated. Unlike reset_grid, surviving values are untouched."""
+        old_count = len(self.column_headers)
+        new_count = len(column_headers)
+        self.beginResetModel()
+        self.column_headers = tuple(column_headers)
+        if len(self._data) != len(self.row_definitions):
+            # Fresh model (or stale stores): allocate one store per row
+            # outright, since there is nothing in place to resize yet
+            self._data = [self._make_row_store(row_def, new_count)
+                          for row_def in self.row_definitions]
+        elif new_count < old_count:
+            for store in self._data:
+                del store[new_count:]
+        elif new_count > old_count:
+            extra = new_count - old_count
+            for row_def, store in zip(self.row_definitions, self._data):
+                store.extend([self.default_value(row_def)] * extra)
+        self.endResetModel()
+
+    def reset_grid(self, row_definitions, column_headers):
+        """Rebuilds the backing store for new rows/columns with default values.
+
+        Numeric rows are stored as contiguous unboxed doubles (array('d'))
+        rather than one boxed Python object per cell."""
+        self.beginResetModel()
+        self.row_definitions = row_definitions
+        self.column_headers = tuple(column_headers)
+        num_columns = len(self.column_headers)
+        self._data = [self._make_row_store(row_def, num_columns) for row_def in row_definitions]
+        self.endResetModel()
+
+    @classmethod
+    def _make_row_store(cls, row_def, num_columns):
+        """Allocates the backing store for one row: unboxed doubles for
+        numeric rows, unboxed bytes for checkbox rows, a list otherwise."""
+        default = cls.default_value(row_def)
+        cell_type = row_def.get("type", "checkbox")
+        if cell_type == "numeric":
+            return array('d', [default] * num_columns)
+        elif cell_type == "checkbox":
+            return array('b', [default] * num_columns)
+        return [default] * num_columns
+
+    def patch_rows(self, new_row_definitions):
+        """Diffs new row definitions against the current ones, keeping the
+        backing stores of unchanged rows instead of rebuilding everything."""
+        old_definitions = self.row_definitions
+        num_columns = len(self.column_headers)
+        self.beginResetModel()
+        new_data = []
+        for i, row_def in enumerate(new_row_definitions):
+            if i < len(old_definitions) and i < len(self._data) and old_definitions[i] == row_def:
+                new_data.append(self._data[i])
+            else:
+                new_data.append(self._make_row_store(row_def, num_columns))
+        self.row_definitions = new_row_definitions
+        self._data = new_data
+        self.endResetModel()
+
+    def get_value(self, row, col):
+        return self._data[row][col]
+
+    def set_value(self, row, col, value):
+        row_store = self._data[row]
+        if isinstance(row_store, array):
+            if row_store.typecode == 'b':
+                row_store[col] = 1 if value in (1, True, "ON") else 0
+            elif isinstance(value, (int, float)):
+                # Spin-box edits and state restores arrive as numbers already
+                row_store[col] = value
+            elif not value:
+                # Empty cells skip the parse entirely (covers None and "")
+                row_store[col] = 0.0
+            else:
+                try:
+                    row_store[col] = float(value)
+                except (ValueError, TypeError):
+                    row_store[col] = 0.0
+        else:
+            row_store[col] = value
+
+    def refresh(self):
+        """Notifies views after bulk writes through set_value."""
+        if self._data and self.column_headers:
+            top_left = self.index(0, 0)
+            bottom_right = self.index(len(self._data) - 1, len(self.column_headers) - 1)
+            self.dataChanged.emit(top_left, bottom_right)
+
+
+class W2ItemDelegate(QStyledItemDelegate):
+    """Creates typed cell editors on demand instead of one widget per cell."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One QStringListModel per distinct option list, shared by all
+        # combo editors instead of re-adding the same items per cell
+        self._option_models = {}
+        # Editor factories with pre-bound range/options, keyed by the
+        # row definition's editing-relevant values
+        self._editor_factories = {}
+
+    def _options_model(self, options):
+        key = tuple(options)
+        model = self._option_models.get(key)
+        if model is None:
+            model = QStringListModel(list(options), self)
+            self._option_models[key] = model
+        return model
+
+    def _make_editor_factory(self, row_def):
+        """Partial-evaluates one row definition into a closure that builds its
+        editor directly, with no per-edit dict lookups or branching."""
+        cell_type = row_def.get("type", "checkbox")
+        if cell_type == "numeric":
+            # Branch on decimal_places first so only one spin box is built
+            if "decimal_places" in row_def:
+                decimals = row_def["decimal_places"]
+                minimum = row_def.get("min", 0.0)
+                maximum = row_def.get("max", 999999.0)
+
+                def factory(parent):
+                    editor = QDoubleSpinBox(parent)
+                    editor.setDecimals(decimals)
+                    editor.setMinimum(minimum)
+                    editor.setMaximum(maximum)
+                    return editor
+            else:
+                minimum = row_def.get("min", 0)
+                maximum = row_def.get("max", 999999)
+
+                def factory(parent):
+                    editor = QSpinBox(parent)
+                    editor.setMinimum(minimum)
+                    editor.setMaximum(maximum)
+                    return editor
+        elif cell_type == "dropdown":
+            options_model = self._options_model(row_def.get("options", []))
+
+            def factory(parent):
+                editor = QComboBox(parent)
+                editor.setModel(options_model)
+                return editor
+        else:
+            factory = QLineEdit
+        return factory
+
+    def createEditor(self, parent, option, index):
+        row_def = index.model().row_definitions[index.row()]
+        key = (row_def.get("type", "checkbox"), row_def.get("decimal_places"),
+               row_def.get("min"), row_def.get("max"), tuple(row_def.get("options", ())))
+        factory = self._editor_factories.get(key)
+        if factory is None:
+            factory = self._make_editor_factory(row_def)
+            self._editor_factories[key] = factory
+        return factory(parent)
+
+    def setEditorData(self, editor, index):
+        value = index.data(_EDIT_ROLE)
+        if isinstance(editor, QSpinBox):
+            try:
+                editor.setValue(int(float(value)))
+            except (ValueError, TypeError):
+                editor.setValue(editor.minimum())
+        elif isinstance(editor, QDoubleSpinBox):
+            try:
+                editor.setValue(float(value))
+            except (ValueError, TypeError):
+                editor.setValue(editor.minimum())
+        elif isinstance(editor, QComboBox):
+            editor.setCurrentText(value if value else "")
+        elif isinstance(editor, QLineEdit):
+            editor.setText(value if value else "")
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, (QSpinBox, QDoubleSpinBox)):
+            # Hand the number over as-is; set_value stores it without a parse
+            model.setData(index, editor.value(), _EDIT_ROLE)
+        elif isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText(), _EDIT_ROLE)
+        elif isinstance(editor, QLineEdit):
+            model.setData(index, editor.text(), _EDIT_ROLE)
+
+
 class TabularDataTab(QWidget):
     """A widget for a tabular data entry based on a dynamic number of columns."""
     # Emitted when a numeric cell that affects table structure changes (e.g., NSTR)
@@ -146,195 +969,140 @@ class TabularDataTab(QWidget):
 
     def __init__(self, row_definitions, tab_name=None, parent=None):
         super().__init__(parent)
+        # Interned tag checked on hot paths instead of isinstance
+        self.kind = "tabular"
         self.row_definitions = row_definitions
         self.tab_name = tab_name  # Store tab name directly
-        self.table = QTableWidget()
-        self.table.setRowCount(len(self.row_definitions))
-        
+        self.model = W2TableModel(row_definitions, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(W2ItemDelegate(self.table))
+
         # Preserve the original/base row definitions to support dynamic row extension
         self.base_row_definitions = list(row_definitions)
-        
-        # Set the vertical headers and tooltips
-        for i, row_def in enumerate(self.row_definitions):
-            item = QTableWidgetItem(row_def['label'])
-            item.setToolTip(row_def['description'])
-            self.table.setVerticalHeaderItem(i, item)
-            
+
+        # Index rows by label for O(1) lookup in set_data
+        self._row_index_by_label = {rd['label']: i for i, rd in enumerate(row_definitions)}
+
+        # True while set_data/clear_fields write programmatically, so their
+        # dataChanged bursts do not masquerade as user structure edits
+        self._restoring = False
+
+        # If this is the Structures tab, forward NSTR edits for real-time sync
+        self.model.dataChanged.connect(self._on_model_data_changed)
+
         self.setLayout(QVBoxLayout())
         self.layout().addWidget(self.table)
-    
+
+    def _on_model_data_changed(self, top_left, bottom_right, roles=None):
+        """Emits structureChanged when an edited row affects table structure (e.g., NSTR)."""
+        if self._restoring or self.tab_name != "Structures":
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if self.row_definitions[row].get("label") == "NSTR":
+                self.structureChanged.emit()
+                break
+
     def set_columns(self, num_columns):
         """Dynamically sets the number of columns and their headers."""
         # Ensure at least 1 column for display
         num_columns = max(1, num_columns)
-        self.table.setColumnCount(num_columns)
-        
-        # Use stored tab name for correct headers
-        if self.tab_name in ["Timestep Limitations", "Waterbody Definition", "Calculations", "Dead Sea", 
-                             "Heat Exchange", "Ice Cover", "Transport Scheme", "Hydaulic Coefficients", "Vertical Eddy Viscosity"]:
-            column_headers = [f"WB{i+1}" for i in range(num_columns)]
-        elif self.tab_name in ["Branch Geometry", "Initial Conditions", "Interpolation", "Structures"]:
-            column_headers = [f"BR{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Pipes":
-            column_headers = [f"PIPE{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Spillway":
-            column_headers = [f"SP{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Gates":
-            column_headers = [f"GATE{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Pumps":
-            column_headers = [f"PUMP{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Internal Weirs":
-            column_headers = [f"IW{i+1}" for i in range(num_columns)]
-        elif self.tab_name == "Withdrawals":
-            column_headers = [f"WD{i+1}" for i in range(num_columns)]
-        else:
-            column_headers = [f"Col{i+1}" for i in range(num_columns)]
-            
-        self.table.setHorizontalHeaderLabels(column_headers)
-        
-        # Populate each cell with the appropriate widget type
-        for row_index, row_def in enumerate(self.row_definitions):
-            for col_index in range(num_columns):
-                cell_type = row_def.get("type", "checkbox")
-                if cell_type == "checkbox":
-                    item = QTableWidgetItem()
-                    item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                    self.table.setItem(row_index, col_index, item)
-                elif cell_type == "numeric":
-                    spinbox = QSpinBox()
-                    spinbox.setMinimum(row_def.get("min", 0))
-                    spinbox.setMaximum(row_def.get("max", 999999))
-                    if "decimal_places" in row_def:
-                        spinbox = QDoubleSpinBox()
-                        spinbox.setDecimals(row_def["decimal_places"])
-                        spinbox.setMinimum(row_def.get("min", 0.0))
-                        spinbox.setMaximum(row_def.get("max", 999999.0))
-                    # If this is the Structures tab and this numeric row is NSTR, connect signals for real-time update
-                    if self.tab_name == "Structures" and row_def.get("label") == "NSTR":
-                        try:
-                            spinbox.valueChanged.connect(self.structureChanged.emit)
-                        except Exception:
-                            pass
-                    self.table.setCellWidget(row_index, col_index, spinbox)
-                elif cell_type == "text":
-                    line_edit = QLineEdit()
-                    self.table.setCellWidget(row_index, col_index, line_edit)
-                elif cell_type == "dropdown":
-                    combo_box = QComboBox()
-                    combo_box.addItems(row_def.get("options", []))
-                    self.table.setCellWidget(row_index, col_index, combo_box)
 
-    def set_row_definitions(self, new_row_definitions):
-        """Replace row definitions dynamically, preserving existing data where possible."""
-        # Preserve current data and column count
-        current_data = self.get_data()
-        current_columns = self.table.columnCount()
+        # Use stored tab name for correct headers
+        prefix = _HEADER_PREFIX.get(self.tab_name, "Col")
+        column_headers = _numbered_headers(prefix, num_columns)
 
-        # Apply new row definitions
-        self.row_definitions = new_row_definitions
-        self.table.setRowCount(len(self.row_definitions))
+        # Headers derive solely from the prefix and count, so an equal header
+        # list means the grid shape is unchanged and the reset can be skipped
+        if column_headers == self.model.column_headers:
+            return
 
-        # Reset vertical headers and tooltips to match new rows
-        for i, row_def in enumerate(self.row_definitions):
-            item = QTableWidgetItem(row_def['label'])
-            item.setToolTip(row_def.get('description', ''))
-            self.table.setVerticalHeaderItem(i, item)
+        # Suppress viewport repaints while the grid is resized in place;
+        # existing cell values survive, so callers need no get/set round-trip
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.resize_columns(column_headers)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-        # Recreate cells according to current column count and new row types
-        self.set_columns(current_columns)
+    def set_row_definitions(self, new_row_definitions):
+        """Replace row definitions dynamically, preserving existing data where possible."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Diff-and-patch: unchanged rows keep their stores untouched, so no
+            # get_data/set_data snapshot round-trip is needed
+            self.row_definitions = new_row_definitions
+            self._row_index_by_label = {rd['label']: i for i, rd in enumerate(new_row_definitions)}
+            self.model.patch_rows(new_row_definitions)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-        # Restore any overlapping data back into the table
-        self.set_data(current_data)
+    def iter_rows(self):
+        """Yields one value row per definition straight from the backing store,
+        without materializing the whole table."""
+        for row_index, row_def in enumerate(self.row_definitions):
+            row_store = self.model._data[row_index]
+            if isinstance(row_store, array):
+                if row_store.typecode == 'b':
+                    yield ["ON" if v else "OFF" for v in row_store]
+                else:
+                    values = row_store.tolist()
+                    if "decimal_places" not in row_def:
+                        values = [int(v) for v in values]
+                    yield values
+            else:
+                yield list(row_store)
 
     def get_data(self):
         """Returns tabular data as a list of lists."""
-        data = []
-        for row_index, row_def in enumerate(self.row_definitions):
-            row_data = [row_def['label']]
-            for col_index in range(self.table.columnCount()):
-                cell_type = row_def.get("type", "checkbox")
-                if cell_type == "checkbox":
-                    item = self.table.item(row_index, col_index)
-                    value = "ON" if item and item.checkState() == Qt.CheckState.Checked else "OFF"
-                    row_data.append(value)
-                elif cell_type == "numeric":
-                    spinbox = self.table.cellWidget(row_index, col_index)
-                    value = str(spinbox.value()) if spinbox else "0"
-                    row_data.append(value)
-                elif cell_type == "text":
-                    line_edit = self.table.cellWidget(row_index, col_index)
-                    value = line_edit.text() if line_edit else ""
-                    row_data.append(value)
-                elif cell_type == "dropdown":
-                    combo_box = self.table.cellWidget(row_index, col_index)
-                    value = combo_box.currentText() if combo_box else ""
-                    row_data.append(value)
-            data.append(row_data)
-        return data
+        return [[row_def['label'], *values]
+                for row_def, values in zip(self.row_definitions, self.iter_rows())]
 
     def set_data(self, data_list):
         """Sets the tabular data from a list of lists."""
         if not data_list:
             self.clear_fields()
             return
-            
-        for row_index, row_def in enumerate(self.row_definitions):
-            if row_index < len(data_list):
-                row_data = data_list[row_index]
-                for col_index, value in enumerate(row_data[1:]):
-                    if col_index < self.table.columnCount():
-                        cell_type = row_def.get("type", "checkbox")
-                        if cell_type == "checkbox":
-                            item = self.table.item(row_index, col_index)
-                            if item:
-                                item.setCheckState(Qt.CheckState.Checked if value == "ON" else Qt.CheckState.Unchecked)
-                        elif cell_type == "numeric":
-                            spinbox = self.table.cellWidget(row_index, col_index)
-                            if spinbox:
-                                try:
-                                    if isinstance(spinbox, QSpinBox):
-                                        spinbox.setValue(int(value))
-                                    elif isinstance(spinbox, QDoubleSpinBox):
-                                        spinbox.setValue(float(value))
-                                except (ValueError, TypeError):
-                                    if isinstance(spinbox, QSpinBox):
-                                        spinbox.setValue(spinbox.minimum())
-                                    elif isinstance(spinbox, QDoubleSpinBox):
-                                        spinbox.setValue(spinbox.minimum())
-                        elif cell_type == "text":
-                            line_edit = self.table.cellWidget(row_index, col_index)
-                            if line_edit:
-                                line_edit.setText(value)
-                        elif cell_type == "dropdown":
-                            combo_box = self.table.cellWidget(row_index, col_index)
-                            if combo_box:
-                                combo_box.setCurrentText(value)
+
+        num_columns = self.model.columnCount()
+        # Bind the per-cell lookups once; the loops below run rows x columns
+        set_value = self.model.set_value
+        row_index_of = self._row_index_by_label.get
+        self.table.setUpdatesEnabled(False)
+        self._restoring = True
+        try:
+            for row_data in data_list:
+                row_index = row_index_of(row_data[0])
+                if row_index is None:
+                    continue
+                for col_index, value in enumerate(islice(row_data, 1, None)):
+                    if col_index < num_columns:
+                        set_value(row_index, col_index, value)
+            self.model.refresh()
+        finally:
+            self._restoring = False
+            self.table.setUpdatesEnabled(True)
 
     def clear_fields(self):
-        """Clears all fields in the table based on their type."""
-        for row_index, row_def in enumerate(self.row_definitions):
-            for col_index in range(self.table.columnCount()):
-                cell_type = row_def.get("type", "checkbox")
-                if cell_type == "checkbox":
-                    item = self.table.item(row_index, col_index)
-                    if item:
-                        item.setCheckState(Qt.CheckState.Unchecked)
-                elif cell_type == "numeric":
-                    spinbox = self.table.cellWidget(row_index, col_index)
-                    if spinbox:
-                        spinbox.setValue(spinbox.minimum())
-                elif cell_type == "text":
-                    line_edit = self.table.cellWidget(row_index, col_index)
-                    if line_edit:
-                        line_edit.clear()
-                elif cell_type == "dropdown":
-                    combo_box = self.table.cellWidget(row_index, col_index)
-                    if combo_box:
-                        combo_box.setCurrentIndex(0)
+        """Clears all fields in the table back to their default values."""
+        num_columns = self.model.columnCount()
+        set_value = self.model.set_value
+        self.table.setUpdatesEnabled(False)
+        self._restoring = True
+        try:
+            for row_index, row_def in enumerate(self.row_definitions):
+                default = W2TableModel.default_value(row_def)
+                for col_index in range(num_columns):
+                    set_value(row_index, col_index, default)
+            self.model.refresh()
+        finally:
+            self._restoring = False
+            self.table.setUpdatesEnabled(True)
 
 class CompactApp(QWidget):
-    APP_STATE_FILE = "app_state.json"
+    # JSON Lines: one record per tab, so single-tab saves can append a line
+    # instead of rewriting the whole file
+    APP_STATE_FILE = "app_state.ndjson"
 
     def __init__(self):
         super().__init__()
@@ -342,382 +1110,24 @@ class CompactApp(QWidget):
         self.setGeometry(100, 100, 800, 600)
         # Reentrancy guard for syncs triggered by UI changes
         self._sync_in_progress = False
-        self.tab_data = {
-            "Grid Dimensions and General Settings": {
-                "fields": [
-                    {"label": "NWB", "type": "numeric", "description": "Number of waterbodies in the computational grid"},
-                    {"label": "NBR", "type": "numeric", "description": "Number of branches in the computational grid"},
-                    {"label": "IMX", "type": "numeric", "description": "Number of segments in the computational grid"},
-                    {"label": "KMX", "type": "numeric", "description": "Number of layers in the computational grid"},
-                    {"label": "NPROC", "type": "numeric", "description": "# of processors (INACTIVE at this time)"},
-                    {"label": "CLOSEC", "type": "checkbox", "description": "close dialog box after executing if checked"}
-                ], "columns": 2
-            },
-            "Inflow/Outflow Dimensions": {
-                "fields": [
-                    {"label": "NTR", "type": "numeric", "description": "Number of tributaries"},
-                    {"label": "NST", "type": "numeric", "description": "Number of structures"},
-                    {"label": "NIW", "type": "numeric", "description": "Number of internal weirs"},
-                    {"label": "NWD", "type": "numeric", "description": "Number of withdrawals"},
-                    {"label": "NGT", "type": "numeric", "description": "Number of gates"},
-                    {"label": "NSP", "type": "numeric", "description": "Number of spillways"},
-                    {"label": "NPI", "type": "numeric", "description": "Number of pipes"},
-                    {"label": "NPU", "type": "numeric", "description": "Number of pumps"}
-                ], "columns": 2
-            },
-            "Constituent Dimensions": {
-                "fields": [
-                    {"label": "NGC", "type": "numeric", "description": "Number of generic constituents"},
-                    {"label": "NSS", "type": "numeric", "description": "Number of inorganic suspended solids"},
-                    {"label": "NAL", "type": "numeric", "description": "Number of algal groups"},
-                    {"label": "NEP", "type": "numeric", "description": "Number of epiphyton groups"},
-                    {"label": "NBOD", "type": "numeric", "description": "Number of CBOD groups"},
-                    {"label": "NMC", "type": "numeric", "description": "Number of macrophyte groups"},
-                    {"label": "NZP", "type": "numeric", "description": "Number of zooplankton groups"}
-                ], "columns": 2
-            },
-            "Miscellaneous Dimensions": {
-                "fields": [
-                    {"label": "NDAY", "type": "numeric", "description": "Maximum number of output dates or timestep related changes"},
-                    {"label": "SELECTC", "type": "checkbox", "description": "Turn ON/OFF USGS automatic port selection from a multiple outlet structure where level is chosen by model to reach temperature target"},
-                    {"label": "HABTATC", "type": "checkbox", "description": "Turn ON/OFF habitat analyses for fish and eutrophication variables"},
-                    {"label": "ENVIRPC", "type": "checkbox", "description": "Turn ON/OFF environmental performance criteria"},
-                    {"label": "AERATEC", "type": "checkbox", "description": "Turn ON/OFF aeration to waterbody with dissolved oxygen probe control"},
-                    {"label": "INITUWL", "type": "checkbox", "description": "Turn ON/OFF initial water surface slope and velocity calculation for a river system"},
-                    {"label": "ORGCC", "type": "checkbox", "description": "Turn ON/OFF simulates the organic matter as C rather than organic matter"},
-                    {"label": "SED_DIAG", "type": "checkbox", "description": "Turn ON/OFF sediment diagenesis"}
-                ], "columns": 2
-            },
-            "Time Control": {
-                "fields": [
-                    {"label": "TMSTRT", "type": "numeric", "description": "Starting time, Julian day"},
-                    {"label": "TMEND", "type": "numeric", "description": "Ending time, Julian day"},
-                    {"label": "YEAR", "type": "numeric", "description": "Starting year"}
-                ], "columns": 1
-            },
-            "Timestep Control": {
-                "fields": [
-                    {"label": "NDLT", "type": "numeric", "description": "Number of timestep intervals"},
-                    {"label": "DLTMIN", "type": "numeric", "decimal_places": 5, "description": "Minimum timestep, sec"}
-                ], "columns": 1
-            },
-            "Timestep Date": {
-                "fields": [
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Beginning of timestep interval, Julian day"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTD", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"}
-                ], "columns": 2
-            },
-            "Maximum Timestep": {
-                "fields": [
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Maximum timestep, sec"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTMAX", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"}
-                ], "columns": 2
-            },
-            "Timestep Fraction": {
-                "fields": [
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Fraction of calculated maximum timestep necessary for numerical stability"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"},
-                    {"label": "DLTF", "type": "numeric", "decimal_places": 2, "description": "Additional intervals can be specified"}
-                ], "columns": 2
-            },
-            "Timestep Limitations": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "VISC", "type": "checkbox", "description": "Turn ON/OFF waterbody viscosity and density calculations (e.g., for stratification)"},
-                    {"label": "CELC", "type": "checkbox", "description": "Turn ON/OFF cell by cell heat exchange computations"},
-                    {"label": "DLTADD", "type": "checkbox", "description": "Turn ON/OFF calculation of a minimum time step for waterbodies by adding the waterbody time step to the calculated minimum channel time step"}                    
-                ],
-                "columns_from": "NWB"
-            },
-            "Branch Geometry": { 
-                "type": "tabular",
-                "rows": [
-                    {"label": "US", "type": "numeric", "description": "Branch upstream segment"},
-                    {"label": "DS", "type": "numeric", "description": "Branch downstream segment"},
-                    {"label": "UHS", "type": "numeric", "description": "Upstream boundary condition"},
-                    {"label": "DHS", "type": "numeric", "description": "Downstream boundary condition"},
-                    {"label": "NLMIN", "type": "numeric", "description": "Number of Layers"},
-                    {"label": "SLOPE", "type": "numeric", "decimal_places": 4, "description": "Actual slope"},
-                    {"label": "SLOPEC", "type": "numeric", "decimal_places": 4, "description": "Hydraulic equivalent slope (less than or equal to SLOPE)"}
-                ],
-                "columns_from": "NBR"
-            },
-            "Waterbody Definition": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "LAT", "type": "numeric", "decimal_places": 4, "description": "Upstream latitude of branch"},
-                    {"label": "LONG", "type": "numeric", "decimal_places": 4, "description": "Upstream longitude of branch"},
-                    {"label": "EBOT", "type": "numeric", "decimal_places": 4, "description": "Bottom elevation of the last cell of the branch"},
-                    {"label": "BS", "type": "numeric", "decimal_places": 4, "description": "Distance from branch upstream end to last segment cell"},
-                    {"label": "BE", "type": "numeric", "decimal_places": 4, "description": "Distance from branch upstream end to tributary"},
-                    {"label": "JBDN", "type": "numeric", "description": "Downstream branch number"}
-                ],
-                "columns_from": "NWB"
-            },
-            "Initial Conditions": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "T2I", "type": "numeric", "decimal_places": 2, "description": "Initial temperature in Celcius"},
-                    {"label": "ICEI", "type": "numeric", "decimal_places": 2, "description": "Initial ice thickness in meters"},
-                    {"label": "WTYPEC", "type": "dropdown", "options": ["FRESH", "SALT"], "description": "Water type (FRESH or SALT)"},
-                    {"label": "GRIDC", "type": "dropdown", "options": ["RECT", "TRAP"], "description": "Grid cell shape (RECT or TRAP)"}
-                ],
-                "columns_from": "NBR"
-            },
-            "Calculations": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "VBC", "type": "checkbox", "description": "Volume balance calculation, ON or OFF"},
-                    {"label": "EBC", "type": "checkbox", "description": "Thermal energy balance calculation, ON or OFF"},
-                    {"label": "MBC", "type": "checkbox", "description": "Mass balance calculation, ON or OFF"},
-                    {"label": "PQC", "type": "checkbox", "description": "Density placed inflows, ON or OFF"},
-                    {"label": "EVC", "type": "checkbox", "description": "Evaporation included in water budget, ON or OFF"},
-                    {"label": "PRC", "type": "checkbox", "description": "Precipitation included, ON or OFF"},                    
-                ],
-                "columns_from": "NWB"
-            },
-            "Dead Sea": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "WINDC", "type": "checkbox", "description": "Turn ON/OFF wind"},
-                    {"label": "QINC", "type": "checkbox", "description": "Turn ON/OFF all sources of water"},
-                    {"label": "QOUTC", "type": "checkbox", "description": "Turn ON/OFF all sinks of water"},
-                    {"label": "HEATC", "type": "checkbox", "description": "Turn ON/OFF heat exchange"}                
-                ],
-                "columns_from": "NWB"
-            },
-            "Interpolation": {
-                "type": "tabular",
-                "rows": [                    
-                    {"label": "QINC", "type": "checkbox", "description": "Turn ON/OFF all sources of water"},
-                    {"label": "DTRIC", "type": "checkbox", "description": "Turn ON/OFF all sinks of water"},
-                    {"label": "HDIC", "type": "checkbox", "description": "Turn ON/OFF heat exchange"}                
-                ],
-                "columns_from": "NBR"
-            },
-            "Heat Exchange": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "SLHTC", "type": "dropdown", "options": ["TERM", "ET"],
-                     "description": "Specify either term-by-term (TERM) or equilibrium temperature computations (ET) for surface heat exchange"},
-                    {"label": "SROC", "type": "checkbox", "description": "Read in observed short wave solar radiation, ON or OFF"},
-                    {"label": "RHEVC", "type": "checkbox", "description": "Turns ON/OFF Ryan-Harleman evaporation formula"},
-                    {"label": "METIC", "type": "checkbox", "description": "Turns ON/OFF meteorological data interpolation"},
-                    {"label": "FETCHC", "type": "checkbox", "description": "Turns ON/OFF fetch calculation"},
-                    {"label": "AFW", "type": "numeric", "decimal_places": 2, "description": "a coefficient in the wind speed formulation"},
-                    {"label": "BFW", "type": "numeric", "decimal_places": 2, "description": "b coefficient in the wind speed formulation"},
-                    {"label": "CFW", "type": "numeric", "decimal_places": 2, "description": "ac coefficient in the wind speed formulation"},
-                    {"label": "WINDH", "type": "numeric", "decimal_places": 2, "description": "Wind speed measurement height, m"}               
-                ],
-                "columns_from": "NWB"
-            },
-            "Ice Cover": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "ICEC", "type": "checkbox", "description": "Allow ice calculations"},
-                    {"label": "SLICEC", "type": "dropdown", "options": ["SIMPLE", "DETAIL"], "description": "Specifies the method of ice cover calculations - either SIMPLE or DETAIL"},
-                    {"label": "ALBEDO", "type": "numeric", "decimal_places": 2, "description": "Ratio of reflection to incident radiation (albedo of ice)"},
-                    {"label": "HWI", "type": "numeric", "decimal_places": 2, "description": "Coefficient of water-ice heat exchange"},
-                    {"label": "BETAI", "type": "numeric", "decimal_places": 2, "description": "Fraction of solar radiation absorbed in the ice surface"},
-                    {"label": "GAMMAI", "type": "numeric", "decimal_places": 2, "description": "Solar radiation extinction coefficient, m-1"},
-                    {"label": "ICEMIN", "type": "numeric", "decimal_places": 2, "description": "Minimum ice thickness before ice formation is allowed, m"},
-                    {"label": "ICET2", "type": "numeric", "decimal_places": 2, "description": "Temperature above which ice formation is not allowed, °C"}                
-                ],
-                "columns_from": "NWB"
-            },
-            "Transport Scheme": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "SLTRC", "type": "dropdown", "options": ["ULTIMATE", "QUICKEST", "UPWIND"], 
-                     "description": "Transport solution scheme, ULTIMATE, QUICKEST, or UPWIND"},
-                    {"label": "THETA", "type": "numeric", "decimal_places": 2, "description": "Time-weighting for vertical advection scheme"}           
-                ],
-                "columns_from": "NWB"
-            },
-            "Hydaulic Coefficients": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "AX", "type": "numeric", "decimal_places": 2, "description": "Longitudinal eddy viscosity, m2 sec-1"},
-                    {"label": "DX", "type": "numeric", "decimal_places": 2, "description": "Longitudinal eddy diffusivity, m2 sec-1"},
-                    {"label": "CBHE", "type": "numeric", "decimal_places": 2, "description": "Coefficient of bottom heat exchange, W m-2 sec-1"},
-                    {"label": "TSED", "type": "numeric", "decimal_places": 2, "description": "Sediment temperature, ºC"},
-                    {"label": "FI", "type": "numeric", "decimal_places": 2, "description": "Interfacial friction factor"},
-                    {"label": "TSEDF", "type": "numeric", "decimal_places": 2, "description": "Heat lost to sediments that is added back to water column"},
-                    {"label": "FRICC", "type": "dropdown", "options": ["MANN", "CHEZY"], 
-                     "description": "Bottom friction solution, MANN or CHEZY"}                
-                ],
-                "columns_from": "NWB"
-            },
-            "Vertical Eddy Viscosity": {
-                "type": "tabular",
-                "rows": [                    
-                    {"label": "AZC", "type": "dropdown", "options": ["NICK", "PARAB", "RNG", "W2", "W2N", "TKE"],
-                     "description": "Form of vertical turbulence closure algorithm, NICK, PARAB, RNG, W2, W2N, or TKE"},
-                    {"label": "AZSLC", "type": "dropdown", "options": ["IMP", "EXP"], 
-                     "description": "Specifies either implicit, IMP, or explicit, EXP, treatment of the vertical eddy viscosity in the longitudinal momentum equation"}, 
-                    {"label": "AZMAX", "type": "numeric", "decimal_places": 5, "description": "Maximum value for vertical eddy viscosity, m2 s-1"}                
-                ],
-                "columns_from": "NWB"
-            },
-            "Structures": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "NSTR", "type": "numeric",  "description": "Number of branch outlet structures"},
-                    {"label": "DYNSTRUC", "type": "checkbox", "description": "Use dynamic centerline elevation for the structure, \
-                    usually the centerline elevation is fixed and specified with ESTR. If this is ON, the model will read a separate file for each branch called dynselevX.npt where X is the branch number."}                
-                ],
-                "columns_from": "NBR"
-            },
-            "Pipes": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "IUPI", "type": "numeric", "description": "Upstream segment number"},
-                    {"label": "IDPI", "type": "numeric", "description": "Downstream segment number"},
-                    {"label": "EUPI", "type": "numeric", "decimal_places": 3, "description": "Elevation upstream invert, m"},
-                    {"label": "EDPI", "type": "numeric", "decimal_places": 3, "description": "Elevation downstream invert, m"},
-                    {"label": "WPI", "type": "numeric", "decimal_places": 3, "description": "Pipe diameter, m"},
-                    {"label": "DLXPI", "type": "numeric", "decimal_places": 3, "description": "Pipe length, m"},
-                    {"label": "FPI", "type": "numeric", "decimal_places": 3, "description": "friction factor (Mannings)"},
-                    {"label": "FMINPI", "type": "numeric", "decimal_places": 3, "description": "minor losses friction factor (Mannings)"},
-                    {"label": "WTHLC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "DOWN or LAT, withdrawal control for at end of segment or middle"},
-                    {"label": "DYNPIPE", "type": "checkbox", "description": "Dynamic pipe read input file, ON or OFF"},
-                    {"label": "PUPIC", "type": "dropdown", "options": ["DISTR", "SPECIFY", "DENSITY"], "description": "PipeUp inflow: DISTR, SPECIFY, DENSITY"},
-                    {"label": "ETUPI", "type": "numeric", "decimal_places": 3, "description": "PipeUp Elevation top in m if SPECIFY"},
-                    {"label": "EBUPI", "type": "numeric", "decimal_places": 3, "description": "PipeUp Elevation bottom in m if SPECIFY"},
-                    {"label": "KTUPI", "type": "numeric", "description": "PipeUp Selective withdrawal top layer, Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBUPI", "type": "numeric", "description": "PipeUp Selective withdrawal bottom layer, Bottom layer below which selective withdrawal will not occur"},
-                    {"label": "PDPIC", "type": "dropdown", "options": ["DISTR", "SPECIFY", "DENSITY"], "description": "PipeDown inflow: DISTR, SPECIFY, DENSITY"},
-                    {"label": "ETDPI", "type": "numeric", "decimal_places": 3, "description": "PipeDown Elevation top in m if SPECIFY"},
-                    {"label": "EBDPI", "type": "numeric", "decimal_places": 3, "description": "PipeDown Elevation bottom in m if SPECIFY"},
-                    {"label": "KTDPI", "type": "numeric", "description": "PipeDown Selective withdrawal top layer, Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBDPI", "type": "numeric", "description": "PipeDown Selective withdrawal bottom layer, Bottom layer below which selective withdrawal will not occur"}
-                ],
-                "columns_from": "NPI"
-            },
-            "Spillway": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "IUSP", "type": "numeric", "description": "Upstream segment number, spillway segment location"},
-                    {"label": "IDSP", "type": "numeric", "description": "Downstream segment number, downstream segment spillway outflow enters"},
-                    {"label": "ESP", "type": "numeric", "decimal_places": 3, "description": "Spillway elevation (crest), m"},
-                    {"label": "BTSP1", "type": "numeric", "decimal_places": 3, "description": "Empirical coefficient for free-flowing conditions"},
-                    {"label": "BTSP2", "type": "numeric", "decimal_places": 3, "description": "Empirical coefficient for submerged conditions"},
-                    {"label": "LATSPC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal, DOWN or LAT"},
-                    {"label": "PUSPC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the upstream spillway segment, DISTR, DENSITY, or SPECIFY"},
-                    {"label": "ETUSP", "type": "numeric", "description": "Top elevation spillway inflows enter using SPECIFY option, m"},
-                    {"label": "EBUSP", "type": "numeric", "description": "Bottom elevation spillway inflows enter using SPECIFY option, m"},
-                    {"label": "KTUSP", "type": "numeric", "decimal_places": 3, "description": "Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBUSP", "type": "numeric", "decimal_places": 3, "description": "Bottom layer below which selective withdrawal will not occur"},
-                    {"label": "PDSPC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the downstream spillway segment, DISTR, DENSITY, or SPECIFY"},
-                    {"label": "ETDSP", "type": "numeric", "decimal_places": 3, "description": "Top elevation spillway inflows enter using SPECIFY option, m"},
-                    {"label": "EBDSP", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation spillway inflows enter using SPECIFY option, m"},
-                    {"label": "KTDSP", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBDSP", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
-                    {"label": "GASSPC", "type": "checkbox", "description": "Dissolved gas computations ON or OFF"},
-                    {"label": "EQSP", "type": "numeric", "description": "Equation number for computing dissolved gas"},
-                    {"label": "AGASSP", "type": "numeric", "decimal_places": 3, "description": "a empirical coefficient"},
-                    {"label": "BGASSP", "type": "numeric", "decimal_places": 3, "description": "b empirical coefficient"},
-                    {"label": "CGASSP", "type": "numeric", "decimal_places": 3, "description": "c empirical coefficient"}
-                ],
-                "columns_from": "NSP"
-            },
-            "Gates": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "IUGT", "type": "numeric", "description": "Upstream segment number"},
-                    {"label": "IDGT", "type": "numeric", "description": "Downstream segment number"},
-                    {"label": "EGT", "type": "numeric", "decimal_places": 3, "description": "Gate elevation, m"},
-                    {"label": "A1GT", "type": "numeric", "decimal_places": 3, "description": "a1 coefficient in gate equation for free flowing conditions"},
-                    {"label": "B1GT", "type": "numeric", "decimal_places": 3, "description": "b1 coefficient in gate equation for free flowing conditions"},
-                    {"label": "G1GT", "type": "numeric", "decimal_places": 3, "description": "gamma1 coefficient for free flowing conditions"},
-                    {"label": "A2GT", "type": "numeric", "decimal_places": 3, "description": "a2 coefficient in gate equation for submerged conditions"},
-                    {"label": "B2GT", "type": "numeric", "decimal_places": 3, "description": "b2 coefficient in gate equation for submerged conditions"},
-                    {"label": "G2GT", "type": "numeric", "decimal_places": 3, "description": "gamma2 coefficient for submerged conditions"},
-                    {"label": "LATGTC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal at DOWN or LAT"},
-                    {"label": "PUGTC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter the upstream gate segment, DISTR, DENSITY, or SPECIFY"},
-                    {"label": "ETUGT", "type": "numeric", "decimal_places": 3, "description": "Top elevation gate inflows enter using the SPECIFY option, m"},
-                    {"label": "EBUGT", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation gate inflows enter using the SPECIFY option, m"},
-                    {"label": "KTUGT", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBUGT", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
-                    {"label": "PDGTC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter the downstream gate segment, DISTR, DENSITY, or SPECIFY"},
-                    {"label": "ETDGT", "type": "numeric", "decimal_places": 3, "description": "Top elevation gate inflows enter using the SPECIFY option, m"},
-                    {"label": "EBDGT", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation gate inflows enter using the SPECIFY option, m"},
-                    {"label": "KTDGT", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBDGT", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"},
-                    {"label": "DYNGTC", "type": "dropdown", "options": ["B", "ZGT", "FLOW"], "description": "Either B, ZGT, or FLOW"},
-                    {"label": "GASGTC", "type": "checkbox", "description": "Dissolved gas computations ON or OFF"},
-                    {"label": "EQGT", "type": "numeric", "description": "Equation number for computing dissolved gas"},
-                    {"label": "AGASGT", "type": "numeric", "decimal_places": 3, "description": "a empirical coefficient"},
-                    {"label": "BGASGT", "type": "numeric", "decimal_places": 3, "description": "b empirical coefficient"},
-                    {"label": "CGASGT", "type": "numeric", "decimal_places": 3, "description": "c empirical coefficient"}
-                ],
-                "columns_from": "NGT"
-            },
-            "Pumps": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "IUPU", "type": "numeric", "description": "Upstream segment number where water is withdrawn"},
-                    {"label": "IDPU", "type": "numeric", "description": "Downstream segment number where water enters"},
-                    {"label": "EPU", "type": "numeric", "decimal_places": 3, "description": "Elevation of pump, m"},
-                    {"label": "STRTPU", "type": "numeric", "decimal_places": 3, "description": "Starting day of pumping Julian day"},
-                    {"label": "ENDPU", "type": "numeric", "decimal_places": 3, "description": "Ending day of pumping Julian day"},
-                    {"label": "EONPU", "type": "numeric", "decimal_places": 3, "description": "Pump starting elevation, m"},
-                    {"label": "EOFFPU", "type": "numeric", "decimal_places": 3, "description": "Pump stopping elevation, m"},
-                    {"label": "QPU", "type": "numeric", "decimal_places": 3, "description": "Pump flow rate, m3/s"},
-                    {"label": "LATPUC", "type": "dropdown", "options": ["DOWN", "LAT"], "description": "Downstream or lateral withdrawal, DOWN or LAT"},
-                    {"label": "DYNPUM", "type": "checkbox", "description": "Dynamic pump control ON or OFF"},
-                    {"label": "PPUC", "type": "dropdown", "options": ["DISTR", "DENSITY", "SPECIFY"], "description": "How inflows enter into the downstream pump segment, DISTR, DENSITY, or SPECIFY"},
-                    {"label": "ETPU", "type": "numeric", "decimal_places": 3, "description": "Top elevation inflow enters using SPECIFY option, m"},
-                    {"label": "EBPU", "type": "numeric", "decimal_places": 3, "description": "Bottom elevation inflow enters using SPECIFY option, m"},
-                    {"label": "KTPU", "type": "numeric", "description": "Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBPU", "type": "numeric", "description": "Bottom layer below which selective withdrawal will not occur"}
-                ],
-                "columns_from": "NPU"
-            },
-            "Internal Weirs": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "IWR", "type": "numeric", "description": "Internal weir segment number (RHS)"},
-                    {"label": "KTWR", "type": "numeric", "description": "Internal weir layer top"},
-                    {"label": "KBWR", "type": "numeric", "description": "Internal weir layer bottom"}
-                ],
-                "columns_from": "NIW"
-            },
-            "Withdrawals": {
-                "type": "tabular",
-                "rows": [
-                    {"label": "WDIC", "type": "checkbox", "description": "Withdrawal interpolation, ON or OFF"},
-                    {"label": "IWD", "type": "numeric", "description": "Withdrawal outflow segment"},
-                    {"label": "EWD", "type": "numeric", "decimal_places": 3, "description": "Withdrawal centerline elevation"},
-                    {"label": "KTWD", "type": "numeric", "description": "Withdrawal selective withdrawal top, Top layer above which selective withdrawal will not occur"},
-                    {"label": "KBWD", "type": "numeric", "description": "Withdrawal selective withdrawal bottom, Bottom layer below which selective withdrawal will not occur"}
-                ],
-                "columns_from": "NWD"
-            }
-        }
+        # Memoized dimensions from the last completed sync; None forces a sync
+        self._last_sync_key = None
+        self._structures_dirty = False
+        # Coalesces bursts of structure edits into one deferred sync
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(150)
+        self._sync_timer.timeout.connect(self.sync_tabs)
+        # Last serialized state per tab plus the set of tabs edited since
+        self._gui_state_cache = {}
+        self._dirty_tabs = set()
+        self.tab_data = _TAB_DATA
+
+        # One compiled app-wide rule styles every description label, instead
+        # of a per-label setFont/setStyleSheet pair
+        app = QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(app.styleSheet() + ' QLabel[role="desc"] { color: grey; font: italic 9pt; }')
         self.initUI()
         self.load_gui_state()
         self.sync_tabs()
@@ -725,31 +1135,32 @@ class CompactApp(QWidget):
     def initUI(self):
         main_layout = QHBoxLayout()
         self.tab_list = QListWidget()
-        self.tab_list.itemClicked.connect(self.display_tab)
         self.stacked_widget = QStackedWidget()
 
+        # Tabs are built lazily on first display; placeholders hold their slot
         self.tabs = {}
-        for title, data in self.tab_data.items():
-            if data.get("type") == "tabular":
-                tab_widget = TabularDataTab(data["rows"], tab_name=title)  # Pass tab name
-            else:
-                tab_widget = UserDataTab(data["fields"], columns=data["columns"])
-            self.tabs[title] = tab_widget
+        self._pending_tabs = {}
+        self._pending_state = {}
+        self._tab_indices = {}
+        for index, (title, data) in enumerate(self.tab_data.items()):
+            self._pending_tabs[title] = data
+            self._tab_indices[title] = index
             self.tab_list.addItem(title)
-            self.stacked_widget.addWidget(tab_widget)
-        
-        # Connect real-time structure changes from the Structures tab to sync immediately
-        if isinstance(self.tabs.get("Structures"), TabularDataTab):
-            self.tabs["Structures"].structureChanged.connect(self.sync_tabs)
-        
-        self.tab_list.currentRowChanged.connect(self.sync_tabs)
+            self.stacked_widget.addWidget(QWidget())
+
+        # One handler for clicks and keyboard navigation alike
+        self.tab_list.currentItemChanged.connect(self._on_tab_changed)
 
         self.save_all_button = QPushButton("Save All to CSV")
         self.save_all_button.clicked.connect(self.save_all_to_csv)
 
+        # Non-modal feedback line for save results
+        self.status_label = QLabel("")
+
         right_layout = QVBoxLayout()
         right_layout.addWidget(self.stacked_widget)
         right_layout.addWidget(self.save_all_button)
+        right_layout.addWidget(self.status_label)
 
         main_layout.addWidget(self.tab_list, 1)
         main_layout.addLayout(right_layout, 3)
@@ -759,275 +1170,327 @@ class CompactApp(QWidget):
             self.tab_list.setCurrentRow(0)
             self.display_tab(self.tab_list.item(0))
 
+    @staticmethod
+    def _read_dimension(tab, label):
+        """Reads a dimension count straight from its spin box, defaulting to 0."""
+        if tab is None:
+            return 0
+        widgets = getattr(tab, "_fields_by_label", {}).get(label)
+        if not widgets:
+            return 0
+        widget = widgets[0]
+        if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            return int(widget.value())
+        return 0
+
     def sync_tabs(self):
         """Syncs data between tabs, particularly for dynamic table sizes."""
-        if getattr(self, "_sync_in_progress", False):
+        # Set in __init__, so a plain attribute load suffices here
+        if self._sync_in_progress:
             return
         self._sync_in_progress = True
+        # One repaint for the whole sync instead of one per tab rebuild
+        self.setUpdatesEnabled(False)
         try:
-            nwb_value = 0
-            nbr_value = 0
-            npi_value = 0
-            nsp_value = 0
-            ngt_value = 0
-            npu_value = 0
-            niw_value = 0
-            nwd_value = 0
             grid_tab = self.tabs.get("Grid Dimensions and General Settings")
-            if grid_tab:
-                for label, value in grid_tab.get_data():
-                    if label == "NWB" and value:
-                        try:
-                            nwb_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NBR" and value:
-                        try:
-                            nbr_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-
-            # Read NPI from Inflow/Outflow Dimensions tab for Pipes columns
+            nwb_value = self._read_dimension(grid_tab, "NWB")
+            nbr_value = self._read_dimension(grid_tab, "NBR")
+
+            # Read NPI etc. from Inflow/Outflow Dimensions tab for structure columns
             inflow_tab = self.tabs.get("Inflow/Outflow Dimensions")
-            if inflow_tab:
-                for label, value in inflow_tab.get_data():
-                    if label == "NPI" and value:
-                        try:
-                            npi_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NSP" and value:
-                        try:
-                            nsp_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NGT" and value:
-                        try:
-                            ngt_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NPU" and value:
-                        try:
-                            npu_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NIW" and value:
-                        try:
-                            niw_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif label == "NWD" and value:
-                        try:
-                            nwd_value = int(value)
-                        except (ValueError, TypeError):
-                            pass
+            npi_value = self._read_dimension(inflow_tab, "NPI")
+            nsp_value = self._read_dimension(inflow_tab, "NSP")
+            ngt_value = self._read_dimension(inflow_tab, "NGT")
+            npu_value = self._read_dimension(inflow_tab, "NPU")
+            niw_value = self._read_dimension(inflow_tab, "NIW")
+            nwd_value = self._read_dimension(inflow_tab, "NWD")
  
-            # Sync all NWB-dependent tabs
-            nwb_tabs = ["Timestep Limitations", "Waterbody Definition", "Calculations", "Dead Sea",
-                        "Heat Exchange", "Ice Cover", "Transport Scheme", "Hydaulic Coefficients", "Vertical Eddy Viscosity"]
-            for tab_name in nwb_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, nwb_value))  # Ensure at least 1 column
-                    tab.set_data(current_data)
-
-            # Sync all NBR-dependent tabs
-            nbr_tabs = ["Branch Geometry", "Initial Conditions", "Interpolation", "Structures"]
-            for tab_name in nbr_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, nbr_value))  # Ensure at least 1 column
-                    tab.set_data(current_data)
-
-            # Sync all NPI-dependent tabs
-            npi_tabs = ["Pipes"]
-            for tab_name in npi_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, npi_value))
-                    tab.set_data(current_data)
-
-            # Sync all NSP-dependent tabs
-            nsp_tabs = ["Spillway"]
-            for tab_name in nsp_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, nsp_value))
-                    tab.set_data(current_data)
-
-            # Sync all NGT-dependent tabs
-            ngt_tabs = ["Gates"]
-            for tab_name in ngt_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, ngt_value))
-                    tab.set_data(current_data)
-
-            # Sync all NPU-dependent tabs
-            npu_tabs = ["Pumps"]
-            for tab_name in npu_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, npu_value))
-                    tab.set_data(current_data)
-
-            # Sync all NIW-dependent tabs
-            niw_tabs = ["Internal Weirs"]
-            for tab_name in niw_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, niw_value))
-                    tab.set_data(current_data)
-
-            # Sync all NWD-dependent tabs
-            nwd_tabs = ["Withdrawals"]
-            for tab_name in nwd_tabs:
-                tab = self.tabs.get(tab_name)
-                if tab and isinstance(tab, TabularDataTab):
-                    current_data = tab.get_data()
-                    tab.set_columns(max(1, nwd_value))
-                    tab.set_data(current_data)
+            # Skip the rebuild loops entirely when no dimension changed and no
+            # structure edit is pending
+            sync_key = (nwb_value, nbr_value, npi_value, nsp_value, ngt_value,
+                        npu_value, niw_value, nwd_value)
+            if sync_key == self._last_sync_key and not self._structures_dirty:
+                return
+            # Only rebuild the tab groups whose dimension actually changed;
+            # a None key (first sync or a newly built table) forces all groups.
+            prev_key = self._last_sync_key or (None,) * 8
+
+            # One pass over the dimension groups replaces the former
+            # copy-pasted per-dimension blocks
+            for value, prev, tab_names in zip(sync_key, prev_key, _DIM_TAB_GROUPS):
+                if value == prev:
+                    continue
+                for tab_name in tab_names:
+                    tab = self.tabs.get(tab_name)
+                    if tab is not None and tab.kind == "tabular":
+                        tab.set_columns(max(1, value))
 
             # After NBR-dependent sync, adjust Structures tab rows dynamically based on max NSTR
             structures_tab = self.tabs.get("Structures")
-            if structures_tab and isinstance(structures_tab, TabularDataTab):
-                try:
-                    # Compute maximum NSTR across branches (row labeled 'NSTR')
-                    max_nstr = 0
-                    # Find index of NSTR row in current definitions (should be 0, but search defensively)
-                    nstr_row_index = next((idx for idx, rd in enumerate(structures_tab.row_definitions) if rd.get("label") == "NSTR"), None)
-                    if nstr_row_index is not None:
-                        for col_index in range(structures_tab.table.columnCount()):
-                            widget = structures_tab.table.cellWidget(nstr_row_index, col_index)
-                            if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                                try:
-                                    max_nstr = max(max_nstr, int(widget.value()))
-                                except Exception:
-                                    pass
-                    # Determine current dynamic rows count beyond the base definitions
-                    base_len = len(getattr(structures_tab, 'base_row_definitions', []))
-                    current_dynamic = max(0, len(structures_tab.row_definitions) - base_len)
-
-                    if max_nstr != current_dynamic:
-                        # Build new row definitions: keep base rows, then add placeholders for each structure
-                        new_rows = list(structures_tab.base_row_definitions)
-                        for i in range(max_nstr):
-                            new_rows.append({
-                                "label": f"STRUCT_{i+1}",
-                                "type": "text",
-                                "description": f"Structure {i+1} parameters for each branch"
-                            })
-                        structures_tab.set_row_definitions(new_rows)
-                except Exception:
-                    # Fail-safe: do not break sync if anything unexpected occurs
-                    pass
-        
+            if (structures_tab is not None and structures_tab.kind == "tabular"
+                    and (self._structures_dirty or nbr_value != prev_key[1])):
+                # Compute maximum NSTR across branches (row labeled 'NSTR');
+                # the numeric row store holds floats, so no parsing is needed
+                max_nstr = 0
+                nstr_row_index = structures_tab._row_index_by_label.get("NSTR")
+                if nstr_row_index is not None:
+                    nstr_row = structures_tab.model._data[nstr_row_index]
+                    if len(nstr_row):
+                        max_nstr = int(max(nstr_row))
+                # Determine current dynamic rows count beyond the base definitions
+                base_len = len(structures_tab.base_row_definitions)
+                current_dynamic = max(0, len(structures_tab.row_definitions) - base_len)
+
+                if max_nstr != current_dynamic:
+                    # Keep base rows, then add cached placeholders per structure
+                    new_rows = list(structures_tab.base_row_definitions)
+                    new_rows.extend(_structure_rows(max_nstr))
+                    structures_tab.set_row_definitions(new_rows)
+
+            self._last_sync_key = sync_key
+            self._structures_dirty = False
+
         finally:
             self._sync_in_progress = False
-    
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _on_structure_changed(self):
+        """Marks the Structures tab dirty and schedules a re-sync.
+
+        Holding the arrow keys on the NSTR spin box fires this once per
+        step; the single-shot timer coalesces the burst into one rebuild.
+        """
+        self._structures_dirty = True
+        self._sync_timer.start()
+
+    def _ensure_tab(self, title):
+        """Builds a tab widget the first time it is needed and swaps it in."""
+        if title in self.tabs:
+            return self.tabs[title]
+        data = self._pending_tabs.pop(title, None)
+        if data is None:
+            return None
+
+        if data.get("type") == "tabular":
+            tab_widget = TabularDataTab(data["rows"], tab_name=title)  # Pass tab name
+            # Connect real-time structure changes from the Structures tab to sync immediately
+            if title == "Structures":
+                tab_widget.structureChanged.connect(self._on_structure_changed)
+            # The new table still has zero columns; force the next sync to run
+            self._last_sync_key = None
+        else:
+            tab_widget = UserDataTab(data["fields"], columns=data["columns"])
+            # Dimension edits drive the (debounced) resync; plain tab
+            # switches no longer trigger one
+            if title in ("Grid Dimensions and General Settings",
+                         "Inflow/Outflow Dimensions"):
+                tab_widget.fieldChanged.connect(self._sync_timer.start)
+
+        # Any edit marks the tab for re-serialization on the next state save
+        if tab_widget.kind == "tabular":
+            tab_widget.model.dataChanged.connect(
+                lambda *args, name=title: self._dirty_tabs.add(name))
+        else:
+            tab_widget.fieldChanged.connect(
+                lambda name=title: self._dirty_tabs.add(name))
+
+        index = self._tab_indices[title]
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, tab_widget)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.tabs[title] = tab_widget
+
+        # Size the table from the current dimension values before restoring
+        # state; set_data drops any column the zero-column model cannot hold.
+        # The sync reads the counts straight from the spin boxes, so both
+        # dimension tabs must be built (with their own saved state) first —
+        # otherwise an unopened tab reads as 0 and truncates the restore.
+        if tab_widget.kind == "tabular":
+            self._ensure_tab("Grid Dimensions and General Settings")
+            self._ensure_tab("Inflow/Outflow Dimensions")
+            self.sync_tabs()
+
+        # Apply any state loaded before this tab existed
+        pending = self._pending_state.pop(title, None)
+        if pending is not None:
+            if tab_widget.kind == "user":
+                if isinstance(pending, list):
+                    pending = [tuple(item) for item in pending]
+                elif isinstance(pending, dict):
+                    pending = list(pending.items())
+            tab_widget.set_data(pending)
+            if title == "Structures":
+                # The restore suppressed structureChanged, so the STRUCT_i
+                # rows for the reloaded NSTR values must be rebuilt here
+                self._structures_dirty = True
+                self.sync_tabs()
+        return tab_widget
+
+    def _ensure_all_tabs(self):
+        """Materializes every pending tab (needed before whole-app save/export)."""
+        for title in list(self._pending_tabs):
+            self._ensure_tab(title)
+
+    def _on_tab_changed(self, current, previous):
+        # A visual switch cannot change any dimension, so no sync here;
+        # display_tab still syncs when it materializes a fresh table
+        if current is not None:
+            self.display_tab(current)
+
     def display_tab(self, item: QListWidgetItem):
-        self.sync_tabs()
         tab_name = item.text()
-        tab_widget = self.tabs[tab_name]
+        tab_widget = self._ensure_tab(tab_name)
+        # Re-sync only when _ensure_tab just materialized a table that
+        # still needs its columns
+        if self._last_sync_key is None:
+            self.sync_tabs()
         self.stacked_widget.setCurrentWidget(tab_widget)
 
     def save_all_to_csv(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save All Data to CSV", "w2_con.csv", "CSV Files (*.csv)")
 
         if file_path:
-            try:
-                with open(file_path, 'w', newline='') as file:
-                    writer = csv.writer(file)
-                    
-                    for tab_name, tab_widget in self.tabs.items():
-                        if isinstance(tab_widget, UserDataTab):
-                            current_tab_data = tab_widget.get_data()
-                            labels = [label for label, _ in current_tab_data]
-                            values = [value if value is not None else "" for _, value in current_tab_data]
-                            writer.writerow(labels)
-                            writer.writerow(values)
-                        elif isinstance(tab_widget, TabularDataTab):
-                            tabular_data = tab_widget.get_data()
-                            if tabular_data:
-                                if tab_name in ["Timestep Limitations", "Waterbody Definition", "Calculations", "Dead Sea",
-                                                "Heat Exchange", "Ice Cover", "Transport Scheme", "Hydaulic Coefficients", "Vertical Eddy Viscosity"]:
-                                    headers = [f"WB{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name in ["Branch Geometry", "Initial Conditions", "Interpolation", "Structures"]:
-                                    headers = [f"BR{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Pipes":
-                                    headers = [f"PIPE{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Spillway":
-                                    headers = [f"SP{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Gates":
-                                    headers = [f"GATE{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Pumps":
-                                    headers = [f"PUMP{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Internal Weirs":
-                                    headers = [f"IW{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                elif tab_name == "Withdrawals":
-                                    headers = [f"WD{i+1}" for i in range(len(tabular_data[0]) - 1)]
-                                else:
-                                    headers = []
-                                writer.writerow(headers)
-                                
-                                for row_data in tabular_data:
-                                    writer.writerow(row_data[1:])
-                        writer.writerow([])
-                
-                QMessageBox.information(self, "Success", "All data saved successfully!")
-                self.save_gui_state()
-                for tab_widget in self.tabs.values():
-                    if isinstance(tab_widget, UserDataTab) or isinstance(tab_widget, TabularDataTab):
-                        tab_widget.clear_fields()
-
-            except IOError as e:
-                QMessageBox.critical(self, "Error", f"Error saving file: {e}")
-
-    def save_gui_state(self):
-        all_gui_data = {}
-        for tab_name, tab_widget in self.tabs.items():
-            if isinstance(tab_widget, UserDataTab):
-                data_list_of_lists = [list(item) for item in tab_widget.get_data()]
-                all_gui_data[tab_name] = data_list_of_lists
-            elif isinstance(tab_widget, TabularDataTab):
-                all_gui_data[tab_name] = tab_widget.get_data()
+            self._ensure_all_tabs()
+            self.sync_tabs()
+            # Serialize the whole CSV in memory, then flush it in one write
+            buf = io.StringIO()
+            writer = csv.writer(buf)
 
-        try:
-            with open(self.APP_STATE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(all_gui_data, f, indent=4)
-        except IOError as e:
-            QMessageBox.warning(self, "Save State Error", f"Could not save application state: {e}")
+            # Iterate in schema order; self.tabs fills in materialization order
+            for tab_name in self.tab_data:
+                tab_widget = self.tabs[tab_name]
+                wrote_any = False
+                if tab_widget.kind == "user":
+                    current_tab_data = tab_widget.get_data()
+                    # Tabs the user never filled in contribute nothing
+                    if any(value not in (None, "") for _, value in current_tab_data):
+                        writer.writerows([
+                            [label for label, _ in current_tab_data],
+                            [value if value is not None else "" for _, value in current_tab_data],
+                        ])
+                        wrote_any = True
+                elif tab_widget.kind == "tabular":
+                    num_columns = tab_widget.model.columnCount()
+                    if num_columns:
+                        # Same prefix table the column headers are built from
+                        prefix = _HEADER_PREFIX.get(tab_name)
+                        headers = _numbered_headers(prefix, num_columns) if prefix else ()
+                        writer.writerow(headers)
+                        # Stream data rows lazily; no intermediate list of lists
+                        writer.writerows(tab_widget.iter_rows())
+                        wrote_any = True
+                # Separate only tabs that actually produced rows, so empty
+                # tabs no longer leave runs of blank lines
+                if wrote_any:
+                    writer.writerow([])
+
+            csv_text = buf.getvalue()
+            # Snapshot the app state now too, so one worker flushes both files
+            all_gui_data = self._collect_gui_state()
+            state_path = self.APP_STATE_FILE
+
+            def _write():
+                with open(file_path, 'w', newline='', buffering=1 << 20) as csv_file:
+                    csv_file.write(csv_text)
+                    csv_file.flush()
+                    os.fsync(csv_file.fileno())
+                self._write_state_records(state_path, all_gui_data)
+
+            # The snapshots above ran on the GUI thread; only the disk writes
+            # leave it, so the event loop stays responsive during the flush
+            task = _StateIOTask(_write)
+            task.signals.finished.connect(self._on_csv_saved)
+            task.signals.failed.connect(
+                lambda message: QMessageBox.critical(
+                    self, "Error", f"Error saving file: {message}"))
+            QThreadPool.globalInstance().start(task)
+
+    def _on_csv_saved(self, _result):
+        """Completion handler for the background CSV and state writes."""
+        # Non-modal notice; entered data stays put so the user can continue
+        self.status_label.setText("All data saved successfully!")
+        QTimer.singleShot(5000, lambda: self.status_label.clear())
+
+    def _collect_gui_state(self):
+        """Refreshes the per-tab state cache and returns it in schema order.
+
+        Only tabs edited since the last save are re-serialized; unbuilt tabs
+        keep their cached (loaded) state and never-cached built tabs are
+        captured."""
+        for tab_name in self.tab_data:
+            tab_widget = self.tabs.get(tab_name)
+            if tab_widget is None:
+                continue
+            if tab_name in self._dirty_tabs or tab_name not in self._gui_state_cache:
+                if tab_widget.kind == "user":
+                    self._gui_state_cache[tab_name] = [list(item) for item in tab_widget.get_data()]
+                elif tab_widget.kind == "tabular":
+                    self._gui_state_cache[tab_name] = tab_widget.get_data()
+        self._dirty_tabs.clear()
+        return {tab_name: self._gui_state_cache[tab_name]
+                for tab_name in self.tab_data if tab_name in self._gui_state_cache}
+
+    @staticmethod
+    def _write_state_records(state_path, all_gui_data):
+        """Writes the collected state as NDJSON, one record per tab.
+
+        Runs on a worker thread; the 1 MiB buffer coalesces the syscalls
+        without holding a second full copy of the serialized state."""
+        with open(state_path, 'wb', buffering=1 << 20) as state_file:
+            for tab_name, tab_data in all_gui_data.items():
+                state_file.write(_dumps({"tab": tab_name, "data": tab_data}) + b"\n")
+            state_file.flush()
+            os.fsync(state_file.fileno())
 
     def load_gui_state(self):
         if not os.path.exists(self.APP_STATE_FILE):
             return
 
-        try:
-            with open(self.APP_STATE_FILE, 'r', encoding='utf-8') as f:
-                saved_gui_data = json.load(f)
-
-            for tab_name, tab_data in saved_gui_data.items():
-                if tab_name in self.tabs:
-                    tab_widget = self.tabs[tab_name]
-                    if isinstance(tab_widget, UserDataTab):
-                        data_list = []
-                        if isinstance(tab_data, list):
-                            data_list = [tuple(item) for item in tab_data]
-                        elif isinstance(tab_data, dict):
-                            data_list = list(tab_data.items())
-                        tab_widget.set_data(data_list)
-                    elif isinstance(tab_widget, TabularDataTab):
-                        tab_widget.set_data(tab_data)
-
-        except (IOError, json.JSONDecodeError) as e:
-            QMessageBox.warning(self, "Load State Error", f"Could not load application state: {e}\nStarting with empty fields.")
+        def _read():
+            # Later lines win, so appended single-tab records override old ones
+            saved = {}
+            with open(self.APP_STATE_FILE, 'rb', buffering=1 << 20) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = _loads(line)
+                    saved[record["tab"]] = record["data"]
+            return saved
+
+        # Read and parse off the GUI thread; apply to widgets once parsed
+        task = _StateIOTask(_read)
+        task.signals.finished.connect(self._apply_loaded_state)
+        task.signals.failed.connect(
+            lambda msg: QMessageBox.warning(self, "Load State Error",
+                                            f"Could not load application state: {msg}\nStarting with empty fields."))
+        QThreadPool.globalInstance().start(task)
+
+    def _apply_loaded_state(self, saved_gui_data):
+        """Applies parsed state to the tab widgets on the GUI thread."""
+        self._gui_state_cache.update(saved_gui_data)
+        for tab_name, tab_data in saved_gui_data.items():
+            if tab_name in self.tabs:
+                tab_widget = self.tabs[tab_name]
+                if tab_widget.kind == "user":
+                    data_list = []
+                    if isinstance(tab_data, list):
+                        data_list = [tuple(item) for item in tab_data]
+                    elif isinstance(tab_data, dict):
+                        data_list = list(tab_data.items())
+                    tab_widget.set_data(data_list)
+                elif tab_widget.kind == "tabular":
+                    tab_widget.set_data(tab_data)
+                    if tab_name == "Structures":
+                        # set_data suppresses structureChanged; let the sync
+                        # below regenerate the STRUCT_i rows
+                        self._structures_dirty = True
+            elif tab_name in self._pending_tabs:
+                # Tab not built yet; applied by _ensure_tab on first display
+                self._pending_state[tab_name] = tab_data
+        self.sync_tabs()
         
 if __name__ == "__main__":
     app = QApplication(sys.argv)